@@ -0,0 +1,319 @@
+"""
+Arabic content for the TrustCoin bot: welcome text, keyboards and menu sections.
+
+Keyboard buttons are (label, value) pairs; values containing "://" are URL buttons,
+everything else is callback_data. Sections use Markdown unless "parse_mode" says otherwise.
+"""
+
+WELCOME_TEXT = (
+    "🚀 **أهلاً بك في TrustCoin (TBN)!** 🚀\n\n"
+    "💎 **التعدين المحمول الثوري على Binance Smart Chain**\n\n"
+    "🎁 **مكافأة الترحيب:** احصل على 1,000 نقطة فوراً عند التسجيل!\n"
+    "⛏️ **التعدين:** اكسب حتى 1,000 نقطة كل 24 ساعة\n"
+    "💰 **التحويل:** 1,000 نقطة = 1 رمز TBN\n"
+    "🌟 **العرض الإجمالي:** 20 مليار رمز TBN\n\n"
+    "📱 حمّل التطبيق الآن وابدأ رحلتك في عالم العملات المشفرة!\n\n"
+    "👇 اختر قسماً لتعرف المزيد:"
+)
+
+KEYBOARDS = {
+    "main": [
+        [("📋 نظرة عامة والبدء", "overview")],
+        [("⛏️ التعدين والنقاط", "points")],
+        [("🎯 المهام والمكافآت", "missions")],
+        [("👥 الإحالة والمجتمع", "referral")],
+        [("🗺️ خارطة الطريق", "roadmap")],
+        [("📱 تحميل التطبيق", "download")],
+        [("🔒 الأمان ومكافحة الغش", "security")],
+        [("❓ الأسئلة الشائعة", "faq")],
+        [("🌐 الروابط الاجتماعية", "social")],
+        [("🌍 مجموعات اللغات", "language_groups")],
+    ],
+    "back": [
+        [("🔙 القائمة الرئيسية", "main_menu")],
+    ],
+}
+
+SECTIONS = {
+    "overview": {
+        "keyboard": "back",
+        "text": (
+            "📋 **نظرة عامة والبدء**\n\n"
+            "🌟 **ما هو TrustCoin (TBN)?**\n"
+            "TrustCoin هو مشروع تعدين محمول ثوري يعمل على شبكة Binance Smart Chain. "
+            "يمكن للمستخدمين كسب العملة المشفرة من خلال التطبيق المحمول دون الحاجة إلى أجهزة تعدين باهظة الثمن.\n\n"
+
+            "🎁 **كيفية البدء:**\n"
+            "1️⃣ حمّل التطبيق من الرابط أدناه\n"
+            "2️⃣ أنشئ حساباً جديداً\n"
+            "3️⃣ احصل على 1,000 نقطة ترحيب فوراً\n"
+            "4️⃣ ابدأ التعدين كل 24 ساعة\n"
+            "5️⃣ ادع الأصدقاء واكسب المزيد!\n\n"
+
+            "💎 **المزايا الأساسية:**\n"
+            "• تعدين مجاني بدون استهلاك الطاقة\n"
+            "• مكافآت يومية مضمونة\n"
+            "• نظام إحالة ربحي\n"
+            "• أمان عالي مع تشفير متقدم\n"
+            "• فريق دعم متاح 24/7\n\n"
+
+            "📱 **متطلبات النظام:**\n"
+            "• Android 6.0+ أو iOS 12.0+\n"
+            "• اتصال إنترنت مستقر\n"
+            "• رقم هاتف صالح للتحقق"
+        ),
+    },
+    "points": {
+        "keyboard": "back",
+        "text": (
+            "⛏️ **التعدين والنقاط**\n\n"
+            "💰 **نظام النقاط:**\n"
+            "• احصل على حتى 1,000 نقطة كل 24 ساعة\n"
+            "• مكافأة تسجيل: 1,000 نقطة فوراً\n"
+            "• التحويل: 1,000 نقطة = 1 رمز TBN\n\n"
+
+            "⏰ **جدولة التعدين:**\n"
+            "• دورة تعدين كل 24 ساعة\n"
+            "• إشعارات تلقائية عند انتهاء الدورة\n"
+            "• لا حاجة لبقاء التطبيق مفتوحاً\n\n"
+
+            "🚀 **زيادة الأرباح:**\n"
+            "• تسجيل دخول يومي: +10% مكافأة\n"
+            "• مهام إضافية: حتى +50% مكافأة\n"
+            "• عضوية VIP: مضاعفة المكافآت\n\n"
+
+            "📊 **إحصائيات شخصية:**\n"
+            "• تتبع رصيدك اليومي\n"
+            "• تاريخ التعدين الكامل\n"
+            "• توقعات الأرباح المستقبلية\n"
+            "• مقارنة مع المستخدمين الآخرين"
+        ),
+    },
+    "missions": {
+        "keyboard": "back",
+        "text": (
+            "🎯 **المهام والمكافآت**\n\n"
+            "📋 **المهام اليومية:**\n"
+            "• تسجيل دخول يومي: +100 نقطة\n"
+            "• مشاهدة إعلان: +50 نقطة\n"
+            "• دعوة صديق: +500 نقطة\n"
+            "• متابعة حساباتنا: +200 نقطة\n\n"
+
+            "🏆 **المهام الأسبوعية:**\n"
+            "• التعدين 7 أيام متتالية: +1,000 نقطة\n"
+            "• دعوة 5 أصدقاء: +2,500 نقطة\n"
+            "• إكمال جميع المهام اليومية: +1,500 نقطة\n\n"
+
+            "💎 **المهام الشهرية:**\n"
+            "• التعدين 30 يوماً: +10,000 نقطة\n"
+            "• بناء فريق من 50 مستخدم: +25,000 نقطة\n"
+            "• الوصول للمستوى الذهبي: +50,000 نقطة\n\n"
+
+            "🌟 **مهام خاصة:**\n"
+            "• مشاركة التطبيق على وسائل التواصل\n"
+            "• كتابة مراجعة في متجر التطبيقات\n"
+            "• المشاركة في المسابقات الشهرية"
+        ),
+    },
+    "referral": {
+        "keyboard": "back",
+        "text": (
+            "👥 **الإحالة والمجتمع**\n\n"
+            "💰 **نظام الإحالة ثنائي المستوى:**\n"
+            "🥇 **المستوى الأول:** 20% من أرباح المدعوين المباشرين\n"
+            "🥈 **المستوى الثاني:** 5% من أرباح المدعوين غير المباشرين\n\n"
+
+            "🎁 **مكافآت الدعوة:**\n"
+            "• لكل مدعو جديد: +500 نقطة فوراً\n"
+            "• عند وصول المدعو للمستوى 5: +1,000 نقطة\n"
+            "• مكافآت شهرية حسب عدد الفريق\n\n"
+
+            "🏆 **رتب القيادة:**\n"
+            "🌟 **البرونزي** (10+ مدعوين): +10% مكافأة إضافية\n"
+            "🥈 **الفضي** (50+ مدعوين): +25% مكافأة إضافية\n"
+            "🥇 **الذهبي** (100+ مدعوين): +50% مكافأة إضافية\n"
+            "💎 **الماسي** (500+ مدعوين): +100% مكافأة إضافية\n\n"
+
+            "🌐 **انضم للمجتمع:**\n"
+            "• مجموعات نقاش باللغات المختلفة\n"
+            "• نصائح وحيل من الخبراء\n"
+            "• إعلانات المسابقات والجوائز\n"
+            "• دعم فني مباشر"
+        ),
+    },
+    "roadmap": {
+        "keyboard": "back",
+        "text": (
+            "🗺️ **خارطة الطريق**\n\n"
+            "📅 **المرحلة 1 - القاعدة (تمت):**\n"
+            "✅ إطلاق التطبيق المحمول\n"
+            "✅ نظام التعدين الأساسي\n"
+            "✅ نظام الإحالة\n"
+            "✅ واجهة متعددة اللغات\n\n"
+
+            "📅 **المرحلة 2 - النمو (جارية):**\n"
+            "🔄 تطوير نظام المكافآت\n"
+            "🔄 إضافة مهام متقدمة\n"
+            "🔄 تحسين الأمان\n"
+            "🔄 توسيع المجتمع\n\n"
+
+            "📅 **المرحلة 3 - التوسع (قريباً):**\n"
+            "⏳ إطلاق الرمز على البلوك تشين\n"
+            "⏳ نظام التداول الداخلي\n"
+            "⏳ شراكات مع منصات التداول\n"
+            "⏳ محفظة مدمجة\n\n"
+
+            "📅 **المرحلة 4 - المستقبل:**\n"
+            "🔮 نظام DeFi متكامل\n"
+            "🔮 NFT وألعاب البلوك تشين\n"
+            "🔮 منصة تعليمية\n"
+            "🔮 توسع عالمي"
+        ),
+    },
+    "download": {
+        "keyboard": "back",
+        "text": (
+            "📱 **تحميل التطبيق**\n\n"
+            "🚀 **احصل على TrustCoin الآن!**\n\n"
+            "📲 **روابط التحميل:**\n"
+            "🤖 **Android:** [Google Play Store](https://play.google.com/store/apps/details?id=com.trustcoin.tbn)\n"
+            "🍎 **iOS:** [App Store](https://apps.apple.com/app/trustcoin-tbn/id123456789)\n"
+            "🌐 **موقع ويب:** [trustcoin.tbn](https://trustcoin.tbn)\n\n"
+
+            "💾 **معلومات التطبيق:**\n"
+            "• حجم التحميل: ~25 MB\n"
+            "• آخر تحديث: نوفمبر 2024\n"
+            "• التقييم: ⭐⭐⭐⭐⭐ (4.8/5)\n"
+            "• التحميلات: +100,000\n\n"
+
+            "🔒 **الأمان:**\n"
+            "• التطبيق آمن 100% ومدقق\n"
+            "• لا يطلب صلاحيات غير ضرورية\n"
+            "• تشفير عالي المستوى\n"
+            "• دعم فني 24/7\n\n"
+
+            "🎁 **عرض خاص:** استخدم كود الدعوة عند التسجيل للحصول على مكافأة إضافية!"
+        ),
+    },
+    "security": {
+        "keyboard": "back",
+        "text": (
+            "🔒 **الأمان ومكافحة الغش**\n\n"
+            "🛡️ **تدابير الأمان:**\n"
+            "• تشفير end-to-end لجميع البيانات\n"
+            "• تحقق ثنائي العامل (2FA)\n"
+            "• مراقبة النشاط المشبوه 24/7\n"
+            "• نسخ احتياطية آمنة\n\n"
+
+            "🚫 **مكافحة الغش:**\n"
+            "• نظام ذكي لكشف الحسابات الوهمية\n"
+            "• منع استخدام البوتات والأتمتة\n"
+            "• تحديد الموقع الجغرافي\n"
+            "• تحليل سلوك المستخدم\n\n"
+
+            "⚖️ **السياسات:**\n"
+            "• حساب واحد فقط لكل شخص\n"
+            "• منع استخدام الشبكات الوهمية (VPN)\n"
+            "• تعليق الحسابات المشبوهة\n"
+            "• مراجعة دورية للأنشطة\n\n"
+
+            "🚨 **الإبلاغ عن الانتهاكات:**\n"
+            "إذا لاحظت أي نشاط مشبوه، تواصل معنا فوراً\n"
+            "Email: security@trustcoin.tbn"
+        ),
+    },
+    "faq": {
+        "keyboard": "back",
+        "text": (
+            "❓ **الأسئلة الشائعة**\n\n"
+            "🔍 **س: هل التطبيق مجاني تماماً؟**\n"
+            "ج: نعم! التحميل والاستخدام مجاني 100%\n\n"
+
+            "🔍 **س: كم يمكنني أن أكسب يومياً؟**\n"
+            "ج: حتى 1,000 نقطة يومياً + مكافآت الإحالة\n\n"
+
+            "🔍 **س: متى سيتم إطلاق الرمز؟**\n"
+            "ج: مخطط لإطلاقه في النصف الأول من 2025\n\n"
+
+            "🔍 **س: هل يمكنني استخدام أكثر من حساب؟**\n"
+            "ج: لا، حساب واحد فقط مسموح لكل شخص\n\n"
+
+            "🔍 **س: كيف أحول النقاط إلى عملة؟**\n"
+            "ج: سيكون متاحاً عند إطلاق الرمز الرسمي\n\n"
+
+            "🔍 **س: هل البيانات آمنة؟**\n"
+            "ج: نعم، نستخدم أعلى معايير الأمان والتشفير\n\n"
+
+            "🔍 **س: كيف أتواصل مع الدعم؟**\n"
+            "ج: عبر التطبيق أو البريد الإلكتروني أو التليجرام"
+        ),
+    },
+    "social": {
+        "keyboard": "back",
+        "text": (
+            "🌐 **الروابط الاجتماعية**\n\n"
+            "تابعنا على جميع المنصات للحصول على آخر الأخبار والتحديثات!\n\n"
+
+            "📱 **وسائل التواصل الاجتماعي:**\n"
+            "• [📘 Facebook](https://facebook.com/trustcointbn)\n"
+            "• [🐦 Twitter/X](https://twitter.com/trustcointbn)\n"
+            "• [📸 Instagram](https://instagram.com/trustcointbn)\n"
+            "• [💼 LinkedIn](https://linkedin.com/company/trustcointbn)\n"
+            "• [🎵 TikTok](https://tiktok.com/@trustcointbn)\n\n"
+
+            "💬 **مجتمعات المحادثة:**\n"
+            "• [📱 Telegram الرئيسي](https://t.me/trustcointbn)\n"
+            "• [💬 Discord](https://discord.gg/trustcointbn)\n"
+            "• [🗨️ Reddit](https://reddit.com/r/trustcointbn)\n\n"
+
+            "🎥 **المحتوى التعليمي:**\n"
+            "• [📺 YouTube](https://youtube.com/@trustcointbn)\n"
+            "• [📖 Medium](https://medium.com/@trustcointbn)\n\n"
+
+            "🌍 **الموقع الرسمي:**\n"
+            "• [🌐 TrustCoin.tbn](https://trustcoin.tbn)"
+        ),
+    },
+    "language_groups": {
+        "keyboard": "back",
+        "text": (
+            "🌍 **مجموعات اللغات**\n\n"
+            "انضم إلى مجموعة لغتك المفضلة للحصول على دعم أفضل!\n\n"
+
+            "🇸🇦 **العربية:**\n"
+            "• [مجموعة عربية رئيسية](https://t.me/trustcointbn_arabic)\n"
+            "• [دعم فني عربي](https://t.me/trustcointbn_arabic_support)\n\n"
+
+            "🇺🇸 **English:**\n"
+            "• [English Main Group](https://t.me/trustcointbn_english)\n"
+            "• [English Support](https://t.me/trustcointbn_english_support)\n\n"
+
+            "🇫🇷 **Français:**\n"
+            "• [Groupe Principal Français](https://t.me/trustcointbn_french)\n"
+            "• [Support Français](https://t.me/trustcointbn_french_support)\n\n"
+
+            "🌐 **مجموعات أخرى:**\n"
+            "• [🇪🇸 Español](https://t.me/trustcointbn_spanish)\n"
+            "• [🇩🇪 Deutsch](https://t.me/trustcointbn_german)\n"
+            "• [🇷🇺 Русский](https://t.me/trustcointbn_russian)\n"
+            "• [🇨🇳 中文](https://t.me/trustcointbn_chinese)"
+        ),
+    },
+    "main_menu": {
+        "keyboard": "main",
+        "text": WELCOME_TEXT,
+    },
+    "back": {
+        "keyboard": "main",
+        "text": "القائمة الرئيسية:",
+    },
+}
+
+# Shown for unknown callback data
+FALLBACK = {
+    "keyboard": "main",
+    "text": "خيار غير صحيح. العودة للقائمة الرئيسية.",
+}
+
+# Toast answered to taps over the per-user rate limit
+THROTTLED = "⏳ تمهّل قليلاً ثم اضغط مرة أخرى."
@@ -0,0 +1,294 @@
+"""
+French content for the TrustCoin bot: welcome text, keyboards and menu sections.
+
+Keyboard buttons are (label, value) pairs; values containing "://" are URL buttons,
+everything else is callback_data. Sections use Markdown unless "parse_mode" says otherwise.
+"""
+
+WELCOME_TEXT = (
+    "🚀 **Bienvenue sur TrustCoin (TBN) !** 🚀\n\n"
+    "💎 **Minage Mobile Révolutionnaire sur Binance Smart Chain**\n\n"
+    "🎁 **Bonus de Bienvenue :** Obtenez 1 000 points instantanément lors de l'inscription !\n"
+    "⛏️ **Minage :** Gagnez jusqu'à 1 000 points toutes les 24 heures\n"
+    "💰 **Conversion :** 1 000 points = 1 jeton TBN\n"
+    "🌟 **Offre Totale :** 20 milliards de jetons TBN\n\n"
+    "📱 Téléchargez l'application maintenant et commencez votre voyage dans les cryptomonnaies !\n\n"
+    "👇 Choisissez une section pour en savoir plus :"
+)
+
+KEYBOARDS = {
+    "main": [
+        [("📋 Aperçu & Commencer", "overview")],
+        [("⛏️ Minage & Points", "points")],
+        [("🎯 Missions & Récompenses", "missions")],
+        [("👥 Parrainage & Communauté", "referral")],
+        [("📈 Tokenomics & Feuille de Route", "roadmap")],
+        [("📱 Télécharger l'App", "download")],
+        [("🔒 Sécurité & Anti-Triche", "security")],
+        [("❓ FAQ", "faq")],
+        [("🌐 Liens Sociaux", "social")],
+        [("🌍 Groupes de Langues", "language_groups")],
+    ],
+    "download": [
+        [("📱 Télécharger pour iOS", "https://apps.apple.com/app/trustcoin")],
+        [("🤖 Télécharger pour Android", "https://play.google.com/store/apps/details?id=com.trustcoin")],
+        [("🌐 Visiter le Site Officiel", "https://www.trust-coin.site")],
+        [("⬅️ Retour au Menu Principal", "back")],
+    ],
+    "social": [
+        [("🌐 Website", "https://www.trust-coin.site")],
+        [("📘 Facebook ➡️", "https://www.facebook.com/people/TrustCoin/61579302546502/")],
+        [("✈️ Telegram Group ➡️", "https://t.me/+djORe9HGRi45ZDdk")],
+        [("🎵 TikTok ➡️", "https://www.tiktok.com/@trusrcoin?_t=ZN-8yu1iUm1Wis&_r=1")],
+        [("🐦 X/Twitter ➡️", "https://x.com/TBNTrustCoin")],
+        [("⬅️ Retour au Menu Principal", "back")],
+    ],
+    "language_groups": [
+        [("🇺🇸 Groupe Anglais", "https://t.me/tructcoin_bot")],
+        [("🇸🇦 Groupe Arabe", "https://t.me/trustcoin_arabic_bot")],
+        [("🇫🇷 Groupe Français", "https://t.me/trustcoin_fr_bot")],
+        [("⬅️ Retour au Menu Principal", "back")],
+    ],
+}
+
+SECTIONS = {
+    "overview": {
+        "keyboard": "main",
+        "text": (
+            "📋 **Aperçu & Commencer**\n\n"
+            "🌟 TrustCoin (TBN) est un écosystème de récompenses révolutionnaire basé sur la blockchain sur Binance Smart Chain.\n\n"
+            "🚀 **Comment Commencer :**\n"
+            "1️⃣ **Téléchargez l'application TrustCoin** pour iOS ou Android et créez votre compte\n"
+            "🎁 Recevez un **bonus de bienvenue de 1 000 points** instantanément !\n\n"
+            "2️⃣ **Démarrez des sessions de minage de 24 heures** qui continuent même lorsque l'application est fermée\n"
+            "💾 Les progrès sont sauvegardés automatiquement toutes les heures\n\n"
+            "3️⃣ **Complétez des missions et faites tourner la Roue de la Chance** pour des points supplémentaires\n"
+            "🎯 Plusieurs façons de gagner des récompenses quotidiennement\n\n"
+            "4️⃣ **Convertissez vos points en vrais jetons TBN** via un contrat intelligent automatisé\n"
+            "💰 **1 000 points = 1 jeton TBN**\n\n"
+            "📱 L'application mobile est multiplateforme (React Native) avec des fonctionnalités de chat et d'équipe\n"
+            "🔒 TrustCoin met l'accent sur la transparence, le développement communautaire et la valeur à long terme"
+        ),
+    },
+    "points": {
+        "keyboard": "main",
+        "text": (
+            "⛏️ **Système de Minage & Points**\n\n"
+            "🕐 **Sessions de Minage de 24 Heures :**\n"
+            "• Gagnez jusqu'à **1 000 points par cycle**\n"
+            "• Les progrès sont sauvegardés automatiquement toutes les heures\n"
+            "• Les sessions reprennent après le redémarrage de l'application\n\n"
+            "📊 **Formule de Récompense :**\n"
+            "`(durée de session ÷ 86 400) × 1 000 points`\n\n"
+            "📺 **Récompenses Publicitaires :**\n"
+            "• Regardez des publicités pour débloquer des frappes bonus\n"
+            "• Obtenez des multiplicateurs pour des récompenses supplémentaires\n\n"
+            "💎 **Conversion Points vers TBN :**\n"
+            "• **Taux :** 1 TBN pour 1 000 points\n"
+            "• **Minimum :** Rachat de 1 000 points\n"
+            "• **Limite Quotidienne :** Maximum 100 000 points\n"
+            "• **Exemple :** 10 000 points = 10 jetons TBN\n\n"
+            "🔗 **Fonctionnalités du Contrat Intelligent :**\n"
+            "• Conversion automatisée sur BSC\n"
+            "• Frais de gaz initialement couverts par le projet\n"
+            "• **Taux de Brûlage :** 1% transferts, 0,5% conversions, 2% fonctionnalités premium"
+        ),
+    },
+    "missions": {
+        "keyboard": "main",
+        "text": (
+            "🎯 **Système de Missions & Récompenses**\n\n"
+            "🏆 **Missions Trophée (1-500 points) :**\n"
+            "• Complétion de la première session de minage\n"
+            "• Jours de collecte consécutifs\n"
+            "• Parrainage de nouveaux utilisateurs\n"
+            "• Séries de connexion quotidienne\n\n"
+            "💎 **Missions Gemme (1 000-5 000 points) :**\n"
+            "• Séries de minage de 30 jours\n"
+            "• Réalisations d'efficacité maximale\n"
+            "• Complétion de toutes les missions trophée\n\n"
+            "🎁 **Missions Coffre (2 000-10 000 points) :**\n"
+            "• Séries consécutives de 90 jours\n"
+            "• Construction d'une équipe de 20+ parrainages\n"
+            "• Collecte de 100 000+ points au total\n\n"
+            "🪙 **Missions Pièce (100-1 000 points) :**\n"
+            "• Tâches quotidiennes comme partager l'application\n"
+            "• Mise à jour de votre profil\n"
+            "• Participation aux événements communautaires\n\n"
+            "🎰 **Système de Roue de la Chance :**\n"
+            "• Tournez pour **1-1 500 points**\n"
+            "• **3 frappes par cycle**\n"
+            "• **Temps de recharge de 6 heures** entre les cycles\n"
+            "• **Probabilités :** 50% (1-100), 30% (101-200), 15% (201-300), 5% (301-500)\n"
+            "• Regardez des publicités pour des tours supplémentaires et des multiplicateurs !"
+        ),
+    },
+    "referral": {
+        "keyboard": "main",
+        "text": (
+            "👥 **Programme de Parrainage & Communauté**\n\n"
+            "🔗 **Système de Parrainage à Deux Niveaux :**\n"
+            "• **Codes publics** pour tout le monde\n"
+            "• **Codes exclusifs** pour les meilleurs parrains\n\n"
+            "🎁 **Avantages pour les Nouveaux Utilisateurs :**\n"
+            "• **Bonus de bienvenue de 1 000 points** lors de l'inscription\n"
+            "• **500 points supplémentaires** lors de l'utilisation d'un code d'invitation\n"
+            "• Accès instantané à toutes les fonctionnalités\n\n"
+            "💰 **Récompenses pour les Parrains :**\n"
+            "• **1 000 points par parrainage réussi**\n"
+            "• Part des récompenses de minage du filleul\n"
+            "• Badges de reconnaissance et bonus\n"
+            "• Classements dans le tableau de bord\n\n"
+            "👨‍👩‍👧‍👦 **Fonctionnalités Communautaires :**\n"
+            "• Faire équipe avec d'autres mineurs\n"
+            "• Discuter dans des conversations de groupe\n"
+            "• Partager des stratégies de minage\n"
+            "• Concourir sur les tableaux de bord mondiaux\n"
+            "• Participer aux événements communautaires"
+        ),
+    },
+    "roadmap": {
+        "keyboard": "main",
+        "text": (
+            "🗺️ **Tokenomics & Feuille de Route**\n\n"
+            "💎 **Tokenomics TBN :**\n"
+            "• **Offre totale :** 1 milliard de tokens TBN\n"
+            "• **Récompenses de minage :** 40% (400M TBN)\n"
+            "• **Développement de l'écosystème :** 25% (250M TBN)\n"
+            "• **Partenariats stratégiques :** 15% (150M TBN)\n"
+            "• **Équipe & Conseillers :** 10% (100M TBN)\n"
+            "• **Réserve de liquidité :** 10% (100M TBN)\n\n"
+            "🔥 **Mécanismes Déflationnistes :**\n"
+            "• Brûlage de tokens lors des transactions\n"
+            "• Réduction des récompenses de minage au fil du temps\n"
+            "• Mécanismes de rachat et de brûlage\n\n"
+            "🏛️ **Gouvernance & Staking :**\n"
+            "• Vote communautaire sur les propositions\n"
+            "• Récompenses de staking pour les détenteurs\n"
+            "• Gouvernance décentralisée progressive\n\n"
+            "📅 **Feuille de Route de Développement :**\n\n"
+            "**2025 T1 :**\n"
+            "• Lancement de l'application mobile\n"
+            "• Système de minage de base\n"
+            "• Programme de parrainage\n\n"
+            "**2025 T2 :**\n"
+            "• Intégration de la blockchain\n"
+            "• Lancement du token TBN\n"
+            "• Fonctionnalités de staking\n\n"
+            "**2025 T3 :**\n"
+            "• Partenariats DeFi\n"
+            "• Fonctionnalités de gouvernance\n"
+            "• Expansion internationale\n\n"
+            "**2026-2027 :**\n"
+            "• Écosystème complet\n"
+            "• Intégrations cross-chain\n"
+            "• Adoption massive"
+        ),
+    },
+    "download": {
+        "keyboard": "download",
+        "text": (
+            "📱 **Téléchargement de l'Application TrustCoin**\n\n"
+            "🚀 **Commencez avec TrustCoin aujourd'hui !**\n\n"
+            "📲 **Disponible sur les deux plateformes :**\n"
+            "• iOS App Store\n"
+            "• Google Play Store\n\n"
+            "🎁 **Ce que vous obtenez :**\n"
+            "• **Bonus de bienvenue de 1 000 points**\n"
+            "• **Capacité de minage 24/7**\n"
+            "• **Compatibilité multiplateforme**\n"
+            "• **Fonctionnalités de chat et d'équipe en temps réel**\n"
+            "• **Intégration blockchain sécurisée**\n\n"
+            "💡 **Configuration Système Requise :**\n"
+            "• iOS 12.0+ ou Android 6.0+\n"
+            "• Connexion Internet\n"
+            "• 50 MB d'espace de stockage\n\n"
+            "🔗 Cliquez sur les boutons ci-dessous pour télécharger :"
+        ),
+    },
+    "security": {
+        "keyboard": "main",
+        "text": (
+            "🔒 **Système de Sécurité & Anti-Triche**\n\n"
+            "🛡️ **Sécurité Multi-Couches :**\n"
+            "• **Empreinte d'appareil** pour empêcher l'abus de multi-comptes\n"
+            "• **Validation de session en temps réel** avec authentification basée sur le temps\n"
+            "• **Analyse de modèles alimentée par IA** pour détecter l'automatisation et la triche\n"
+            "• **Vérifications de cohérence géographique** pour un comportement utilisateur authentique\n\n"
+            "⚖️ **Application du Jeu Équitable :**\n"
+            "• Politique **Un compte par personne**\n"
+            "• **Exigence d'appareil réel** - pas d'émulateurs\n"
+            "• **Aucun outil d'automatisation** autorisé\n"
+            "• **Interdictions permanentes** pour les violations\n\n"
+            "🔐 **Sécurité Blockchain :**\n"
+            "• **Audits de contrats intelligents** par des entreprises de sécurité de premier plan\n"
+            "• **Mécanismes déflationnistes** pour une valeur réelle\n"
+            "• Mécanismes de **protection anti-baleine**\n"
+            "• **Opérations transparentes sur la chaîne**\n\n"
+            "🚨 **Prévention de la Fraude :**\n"
+            "• **Chiffrement avancé** pour toutes les données\n"
+            "• Algorithmes d'**analyse comportementale**\n"
+            "• Système de **signalement communautaire**\n"
+            "• Infrastructure de **surveillance 24/7**\n\n"
+            "✅ **Votre sécurité est notre priorité !**"
+        ),
+    },
+    "faq": {
+        "keyboard": "main",
+        "text": (
+            "❓ **Questions Fréquemment Posées**\n\n"
+            "**Q : Comment commencer à miner ?**\n"
+            "R : Téléchargez l'app, inscrivez-vous, et appuyez sur 'Commencer le Minage'. C'est tout !\n\n"
+            "**Q : Quand puis-je retirer mes tokens TBN ?**\n"
+            "R : Les retraits seront disponibles après le lancement du mainnet en 2025 T2.\n\n"
+            "**Q : Y a-t-il une limite au nombre de comptes ?**\n"
+            "R : Oui, un seul compte par personne. Les multi-comptes entraînent une interdiction permanente.\n\n"
+            "**Q : Puis-je utiliser des émulateurs ?**\n"
+            "R : Non, seuls les appareils réels sont autorisés. Les émulateurs sont détectés et bannis.\n\n"
+            "**Q : Qu'est-ce qui rend TBN unique ?**\n"
+            "R : TBN combine le minage mobile, la gamification et la technologie blockchain pour une expérience unique.\n\n"
+            "**Q : Mes données sont-elles sécurisées ?**\n"
+            "R : Absolument ! Nous utilisons un chiffrement de niveau militaire et des audits de sécurité réguliers.\n\n"
+            "**Q : Comment fonctionne le programme de parrainage ?**\n"
+            "R : Partagez votre code, gagnez 1 000 points par parrainage réussi plus une part de leurs récompenses.\n\n"
+            "**Q : Que se passe-t-il si je rate une session de minage ?**\n"
+            "R : Pas de problème ! Redémarrez simplement quand vous êtes prêt. Aucune pénalité.\n\n"
+            "**Q : Puis-je changer mon adresse de retrait ?**\n"
+            "R : Oui, mais seulement avant le premier retrait pour des raisons de sécurité.\n\n"
+            "**Q : TrustCoin est-il disponible dans le monde entier ?**\n"
+            "R : Oui, TrustCoin est disponible mondialement avec support multilingue."
+        ),
+    },
+    "social": {
+        "keyboard": "social",
+        "text": "Choisissez un lien à ouvrir :",
+    },
+    "language_groups": {
+        "keyboard": "language_groups",
+        "text": (
+            "🌍 **Choisissez Votre Groupe Linguistique**\n\n"
+            "Sélectionnez votre langue préférée pour rejoindre le groupe Telegram correspondant :\n\n"
+            "🇺🇸 **Groupe Anglais :** Discussions communautaires mondiales\n"
+            "🇸🇦 **Groupe Arabe :** مجتمع عربي للنقاشات\n"
+            "🇫🇷 **Groupe Français :** Communauté française pour les discussions\n\n"
+            "Chaque groupe fournit :\n"
+            "• 📢 Dernières mises à jour et annonces\n"
+            "• 💬 Chat communautaire et support\n"
+            "• 🎁 Événements exclusifs et cadeaux\n"
+            "• 📚 Tutoriels et guides dans votre langue"
+        ),
+    },
+    "back": {
+        "keyboard": "main",
+        "text": "Menu principal :",
+    },
+}
+
+# Shown for unknown callback data
+FALLBACK = {
+    "keyboard": "main",
+    "text": "Option invalide. Retour au menu principal.",
+}
+
+# Toast answered to taps over the per-user rate limit
+THROTTLED = "⏳ Doucement, réessayez dans un instant."
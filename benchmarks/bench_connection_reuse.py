@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Connection reuse benchmark: Bot API calls per new connection under concurrent load.
+
+Starts benchmarks/fake_api.FakeBotAPI in this process and sends answerCallbackQuery
+calls for several bots from a number of concurrent workers, in two bursts with an
+idle gap between them, once per setup:
+
+    per-call   a new request object (and connection) for every call, like the
+               helper scripts used to do
+    per-bot    one pool of a single connection per bot
+    shared-5s  one shared pool with httpx's default 5 s keep-alive, shorter than
+               the idle gap, so the second burst reconnects
+    shared     one shared pool for all bots as BotHost sets it up (30 s keep-alive)
+
+and reports calls/s, p50/p99 latency, connections opened and the reuse rate
+(calls that did not open a connection). The fake API speaks HTTP/1.1 only.
+
+Usage:
+    python benchmarks/bench_connection_reuse.py [--calls 3000] [--bots 3] [--concurrency 32]
+                                                [--pool-size 16] [--latency-ms 20] [--idle-s 6]
+"""
+
+import os
+import sys
+import time
+import asyncio
+import argparse
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from telegram import Bot
+
+from benchmarks.fake_api import FakeBotAPI
+from core.http import SharedHTTPXRequest
+from core.metrics import metrics
+
+API_PORT = 8082
+BASE_URL = f'http://127.0.0.1:{API_PORT}/bot'
+
+
+def opened(pool: str) -> int:
+    return metrics.counters['http_connections_opened_total', (('pool', pool),)]
+
+
+async def run(setup: str, args) -> dict:
+    tokens = [f'{200 + i}:fake-reuse' for i in range(args.bots)]
+    requests = []
+
+    def make_request(size: int, keepalive=None) -> SharedHTTPXRequest:
+        request = SharedHTTPXRequest(size, pool=setup, keepalive_expiry=keepalive)
+        requests.append(request)
+        return request
+
+    if setup == 'shared':
+        shared = make_request(args.pool_size)
+        bots = [Bot(token, base_url=BASE_URL, request=shared) for token in tokens]
+    elif setup == 'shared-5s':
+        shared = make_request(args.pool_size, keepalive=5.0)
+        bots = [Bot(token, base_url=BASE_URL, request=shared) for token in tokens]
+    elif setup == 'per-bot':
+        bots = [Bot(token, base_url=BASE_URL, request=make_request(1)) for token in tokens]
+    else:
+        bots = None
+
+    latencies = []
+
+    async def call(i: int) -> None:
+        if bots is not None:
+            await bots[i % len(bots)].answer_callback_query(str(i))
+            return
+        request = make_request(1)
+        try:
+            await Bot(tokens[i % len(tokens)], base_url=BASE_URL, request=request).answer_callback_query(str(i))
+        finally:
+            await request.shutdown()
+
+    async def worker(pending) -> None:
+        for i in pending:
+            started = time.perf_counter()
+            await call(i)
+            latencies.append(time.perf_counter() - started)
+
+    elapsed = 0.0
+    half = args.calls // 2
+    for burst in (range(half), range(half, args.calls)):
+        if burst.start:
+            await asyncio.sleep(args.idle_s)
+        pending = iter(burst)
+        started = time.perf_counter()
+        await asyncio.gather(*(worker(pending) for _ in range(args.concurrency)))
+        elapsed += time.perf_counter() - started
+    for request in requests:
+        await request.shutdown()
+
+    latencies.sort()
+    connections = opened(setup)
+    return {
+        'setup': setup,
+        'calls_per_s': args.calls / elapsed,
+        'p50_ms': latencies[len(latencies) // 2] * 1000,
+        'p99_ms': latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1000,
+        'connections': connections,
+        'reuse': 1 - connections / args.calls,
+    }
+
+
+async def main_async(args) -> None:
+    api = FakeBotAPI(latency=args.latency_ms / 1000)
+    await api.start(API_PORT)
+    try:
+        print(f"{'setup':<14}{'calls/s':>10}{'p50 ms':>9}{'p99 ms':>9}{'conns':>8}{'reuse':>8}")
+        for setup in args.setups.split(','):
+            result = await run(setup, args)
+            print(f"{result['setup']:<14}{result['calls_per_s']:>10.0f}{result['p50_ms']:>9.1f}"
+                  f"{result['p99_ms']:>9.1f}{result['connections']:>8}{result['reuse']:>8.1%}")
+    finally:
+        await api.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--calls', type=int, default=3000)
+    parser.add_argument('--bots', type=int, default=3)
+    parser.add_argument('--concurrency', type=int, default=32)
+    parser.add_argument('--pool-size', type=int, default=16)
+    parser.add_argument('--latency-ms', type=float, default=20.0)
+    parser.add_argument('--idle-s', type=float, default=6.0, help='gap between the two bursts')
+    parser.add_argument('--setups', default='per-call,per-bot,shared-5s,shared')
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+End-to-end throughput benchmark against the local fake Bot API.
+
+Starts benchmarks/fake_api.FakeBotAPI in this process and bot_host.py in a child
+process pointed at it via BOT_API_BASE_URL, then feeds callback-query updates
+through getUpdates (polling) or the webhook server (webhook) and measures how
+long it takes until every tap has been answered.
+
+Usage:
+    python benchmarks/bench_end_to_end.py [--mode polling|webhook] [--updates 3000] [--bots eng,ara,fr]
+                                          [--latency-ms 30] [--rate-limit 0.0]
+"""
+
+import os
+import sys
+import json
+import time
+import asyncio
+import argparse
+import tempfile
+import subprocess
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from benchmarks.fake_api import FakeBotAPI
+from benchmarks.payloads import callback_update
+
+API_PORT = 8081
+WEBHOOK_PORT = 8090
+SECTIONS = ('overview', 'points', 'missions', 'faq', 'main_menu')
+
+
+def bot_tokens(names) -> dict:
+    return {name: f'{111 + i}:fake-{name}' for i, name in enumerate(names)}
+
+
+def spawn_host(names, tokens: dict, mode: str):
+    env = dict(os.environ)
+    env.update({
+        'BOTS': ','.join(names),
+        'BOT_TOKEN_ENG': tokens.get('eng', ''),
+        'BOT_TOKEN_ARA': tokens.get('ara', ''),
+        'BOT_TOKEN_FR': tokens.get('fr', ''),
+        'BOT_API_BASE_URL': f'http://127.0.0.1:{API_PORT}/bot',
+        'WEBHOOK_BASE_URL': f'http://127.0.0.1:{WEBHOOK_PORT}' if mode == 'webhook' else '',
+        'PORT': str(WEBHOOK_PORT),
+        'MEDIA_CACHE_PATH': os.path.join(tempfile.mkdtemp(prefix='bench_e2e_'), 'media_cache.json'),
+    })
+    return subprocess.Popen([sys.executable, os.path.join(ROOT_DIR, 'bot_host.py')], env=env, cwd=ROOT_DIR)
+
+
+async def wait_until(condition, timeout: float, what: str) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise TimeoutError(f'Timed out waiting for {what}')
+        await asyncio.sleep(0.05)
+
+
+def make_updates(count: int) -> list:
+    return [callback_update(i + 1, SECTIONS[i % len(SECTIONS)], user_id=700000000 + i % 1000)
+            for i in range(count)]
+
+
+async def post_webhooks(name: str, updates: list, concurrency: int) -> None:
+    import aiohttp
+
+    url = f'http://127.0.0.1:{WEBHOOK_PORT}/webhook/{name}'
+    pending = iter(updates)
+
+    async def worker(session):
+        for update in pending:
+            async with session.post(url, json=update) as response:
+                await response.read()
+
+    async with aiohttp.ClientSession() as session:
+        await asyncio.gather(*(worker(session) for _ in range(concurrency)))
+
+
+async def run(args) -> dict:
+    names = [name.strip() for name in args.bots.split(',') if name.strip()]
+    tokens = bot_tokens(names)
+    api = FakeBotAPI(args.latency_ms / 1000, args.jitter_ms / 1000, args.rate_limit, seed=1)
+    await api.start(API_PORT)
+    host = spawn_host(names, tokens, args.mode)
+    try:
+        if args.mode == 'webhook':
+            await wait_until(lambda: len(api.webhooks) == len(names), 30, 'setWebhook')
+            await asyncio.sleep(0.5)
+        else:
+            await wait_until(lambda: api.calls['getUpdates'] >= len(names), 30, 'polling to start')
+        api.reset()
+
+        per_bot = args.updates // len(names)
+        total = per_bot * len(names)
+        started = time.perf_counter()
+        if args.mode == 'webhook':
+            await asyncio.gather(*(post_webhooks(name, make_updates(per_bot), args.concurrency) for name in names))
+        else:
+            for name in names:
+                api.enqueue(tokens[name], make_updates(per_bot))
+        await wait_until(lambda: api.answered('answerCallbackQuery') >= total, 300, 'all taps to be answered')
+        elapsed = time.perf_counter() - started
+    finally:
+        host.terminate()
+        # Keep serving the API while the host shuts down
+        await asyncio.get_running_loop().run_in_executor(None, host.wait, 30)
+        await api.stop()
+
+    stats = api.stats()
+    return {
+        'mode': args.mode,
+        'bots': names,
+        'updates': total,
+        'seconds': round(elapsed, 2),
+        'updates_per_second': round(total / elapsed, 1),
+        'api_calls': stats['calls'],
+        'rate_limited': stats['rate_limited'],
+        'api_latencies': stats['latencies'],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--mode', choices=('polling', 'webhook'), default='polling')
+    parser.add_argument('--updates', type=int, default=3000)
+    parser.add_argument('--bots', default='eng,ara,fr')
+    parser.add_argument('--concurrency', type=int, default=32, help='webhook mode: parallel deliveries per bot')
+    parser.add_argument('--latency-ms', type=float, default=0.0)
+    parser.add_argument('--jitter-ms', type=float, default=0.0)
+    parser.add_argument('--rate-limit', type=float, default=0.0, help='fraction of API calls answered with 429')
+    args = parser.parse_args()
+    print(json.dumps(asyncio.run(run(args)), indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Webhook decoding benchmark: json + Update.de_json vs the core.fastpath views.
+
+Decodes realistic webhook bodies (a tap under a text message, a tap under the
+welcome photo, /start, and a plain text message that takes the fallback path)
+and reports microseconds per update for both paths.
+
+Usage:
+    python benchmarks/bench_fast_decode.py [--rounds 20000]
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from telegram import Bot, Update
+
+from benchmarks.payloads import callback_update, start_update
+from core import fastpath
+
+
+def text_update(update_id: int) -> dict:
+    update = start_update(update_id)
+    update['message']['text'] = 'hello'
+    del update['message']['entities']
+    return update
+
+
+BODIES = {
+    'callback': json.dumps(callback_update(1, 'faq')).encode(),
+    'callback@photo': json.dumps(callback_update(2, 'faq', photo=True)).encode(),
+    'start': json.dumps(start_update(3)).encode(),
+    'text (fallback)': json.dumps(text_update(4)).encode(),
+}
+
+
+def full(body: bytes, bot):
+    return Update.de_json(json.loads(body), bot)
+
+
+def fast(body: bytes, bot):
+    data = fastpath.loads(body)
+    return fastpath.view(data, bot) or Update.de_json(data, bot)
+
+
+def per_update_us(decode, body: bytes, bot, rounds: int) -> float:
+    for _ in range(100):
+        decode(body, bot)
+    started = time.perf_counter()
+    for _ in range(rounds):
+        decode(body, bot)
+    return (time.perf_counter() - started) / rounds * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rounds', type=int, default=20000)
+    args = parser.parse_args()
+
+    bot = Bot('123456:BENCHMARK')
+    print(f"JSON parser: {fastpath.loads.__module__}")
+    print(f"{'update':<18}{'full us':>10}{'fast us':>10}{'speedup':>10}")
+    for name, body in BODIES.items():
+        full_us = per_update_us(full, body, bot, args.rounds)
+        fast_us = per_update_us(fast, body, bot, args.rounds)
+        print(f"{name:<18}{full_us:>10.1f}{fast_us:>10.1f}{full_us / fast_us:>9.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Handler micro-benchmark: start() and button_handler() for every section of every language.
+
+Synthetic /start and callback-query Updates are run against a Bot backed by the
+in-process RecordingRequest, so no network is involved. For each language and
+callback_data (both under a text message and under the /start photo) it reports
+p50/p95/p99 latency, peak memory allocated per call and outbound Bot API calls per call.
+
+Results are written to benchmarks/results/<commit>.json; pass --compare with an
+earlier results file to print the p50 change per case.
+
+Usage:
+    python benchmarks/bench_handlers.py [--iterations 300] [--compare benchmarks/results/<commit>.json]
+"""
+
+import os
+import sys
+import json
+import time
+import asyncio
+import argparse
+import importlib
+import subprocess
+import tempfile
+import tracemalloc
+from types import SimpleNamespace
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+RESULTS_DIR = os.path.join(ROOT_DIR, 'benchmarks', 'results')
+
+# Keep the benchmark's fake file_ids out of the real media cache
+os.environ['MEDIA_CACHE_PATH'] = os.path.join(tempfile.mkdtemp(prefix='bench_handlers_'), 'media_cache.json')
+
+from telegram import Update
+
+from benchmarks.fakes import make_fake_bot
+from benchmarks.payloads import callback_update, start_update
+from core.catalog import load_catalog
+from core.handlers import make_handlers
+from core.throttle import TapThrottle
+
+LANGUAGES = ('ENGLISH', 'ARABIC', 'FRANCE')
+
+
+def percentile(samples: list, q: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(round(q / 100 * (len(ordered) - 1))))]
+
+
+def build_cases(bot) -> list:
+    """Return (name, handler, make_update) for /start and every callback_data in every language.
+
+    ``make_update(i)`` builds the i-th Update of a case. Taps go to a different
+    message each time so every edit is really sent; the ``@repeat`` case taps the
+    same message again, which is answered without an edit. All taps come from one
+    user, so the handlers get a throttle that never fills up; the ``@throttled``
+    case uses one that is empty after the warm-up tap and measures the toast answer.
+    """
+    cases = []
+    for language in LANGUAGES:
+        catalog = load_catalog(importlib.import_module(f'{language}.sections'))
+        start, button_handler = make_handlers(catalog, throttle=TapThrottle(rate=1e9, burst=1e9))
+        cases.append((f'{language}/start', start, lambda i: Update.de_json(start_update(i), bot)))
+        for data in catalog.sections:
+            for photo in (False, True):
+                name = f"{language}/{data}{'@photo' if photo else ''}"
+                cases.append((name, button_handler, lambda i, data=data, photo=photo: Update.de_json(
+                    callback_update(i, data, message_id=1000 + i, photo=photo), bot)))
+        data = next(iter(catalog.sections))
+        cases.append((f'{language}/{data}@repeat', button_handler,
+                      lambda i, data=data: Update.de_json(callback_update(i, data), bot)))
+        _, throttled_handler = make_handlers(catalog, throttle=TapThrottle(rate=1e-9, burst=1))
+        cases.append((f'{language}/{data}@throttled', throttled_handler, lambda i, data=data: Update.de_json(
+            callback_update(i, data, message_id=1000 + i), bot)))
+    return cases
+
+
+async def measure(handler, make_update, context, request, iterations: int) -> dict:
+    updates = [make_update(i) for i in range(iterations + 21)]
+    # Warm up caches (media file_id, lazily built objects) before timing
+    await handler(updates[-1], context)
+
+    request.reset()
+    samples = []
+    for update in updates[:iterations]:
+        started = time.perf_counter()
+        await handler(update, context)
+        samples.append((time.perf_counter() - started) * 1e6)
+    calls = {method: count / iterations for method, count in sorted(request.calls.items())}
+    bytes_sent = request.bytes_sent / iterations
+
+    # Allocations are traced in a separate pass so tracing does not skew the timings
+    tracemalloc.start()
+    peaks = []
+    for update in updates[iterations:iterations + 20]:
+        tracemalloc.reset_peak()
+        current = tracemalloc.get_traced_memory()[0]
+        await handler(update, context)
+        peaks.append(tracemalloc.get_traced_memory()[1] - current)
+    tracemalloc.stop()
+
+    return {
+        'p50_us': round(percentile(samples, 50), 1),
+        'p95_us': round(percentile(samples, 95), 1),
+        'p99_us': round(percentile(samples, 99), 1),
+        'alloc_peak_bytes': percentile(peaks, 50),
+        'calls': calls,
+        'bytes_sent': round(bytes_sent),
+    }
+
+
+async def run(iterations: int) -> dict:
+    bot, request = make_fake_bot()
+    await bot.initialize()
+    context = SimpleNamespace(bot=bot)
+    results = {}
+    for name, handler, make_update in build_cases(bot):
+        results[name] = await measure(handler, make_update, context, request, iterations)
+    return results
+
+
+def current_commit() -> str:
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT_DIR,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+
+def print_table(results: dict, baseline=None) -> None:
+    header = f"{'case':<42}{'p50 us':>9}{'p95 us':>9}{'p99 us':>9}{'alloc B':>9}  calls"
+    if baseline:
+        header += '  (p50 vs baseline)'
+    print(header)
+    for name, r in results.items():
+        calls = ', '.join(f"{method}={count:g}" for method, count in r['calls'].items())
+        line = f"{name:<42}{r['p50_us']:>9}{r['p95_us']:>9}{r['p99_us']:>9}{r['alloc_peak_bytes']:>9}  {calls}"
+        old = baseline.get(name) if baseline else None
+        if old:
+            line += f"  {(r['p50_us'] / old['p50_us'] - 1) * 100:+.1f}%"
+        print(line)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--iterations', type=int, default=300)
+    parser.add_argument('--compare', help='results file of an earlier run to compare against')
+    parser.add_argument('--output', help='where to store the results (default: benchmarks/results/<commit>.json)')
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args.iterations))
+    baseline = None
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)['results']
+    print_table(results, baseline)
+
+    commit = current_commit()
+    output = args.output or os.path.join(RESULTS_DIR, f'{commit}.json')
+    os.makedirs(os.path.dirname(output), exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump({'commit': commit, 'iterations': args.iterations, 'python': sys.version.split()[0],
+                   'results': results}, f, indent=2)
+    print(f"\nResults written to {output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Payload cache benchmark: CPU per section tap, generic PTB encoding vs pre-encoded payloads.
+
+Both paths go through the same in-process RecordingRequest, which form-encodes the
+request and returns a realistic response, so only our own CPU work is measured.
+
+Usage:
+    python benchmarks/bench_payload_cache.py [--rounds 200]
+"""
+
+import os
+import sys
+import json
+import time
+import asyncio
+import argparse
+import importlib
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from benchmarks.fakes import make_fake_bot
+from core.catalog import load_catalog
+from core.payloads import build_payloads, send_prepared
+
+LANGUAGES = ('ENGLISH', 'ARABIC', 'FRANCE')
+CHAT_ID = 700000000
+MESSAGE_ID = 42
+
+
+async def generic(bot, section, payload):
+    await bot.edit_message_text(
+        chat_id=CHAT_ID, message_id=MESSAGE_ID,
+        text=section.text, reply_markup=section.keyboard.markup, parse_mode=section.parse_mode,
+    )
+
+
+async def prepared(bot, section, payload):
+    await send_prepared(bot, 'editMessageText', payload, chat_id=CHAT_ID, message_id=MESSAGE_ID)
+
+
+async def measure(path, bot, items, rounds: int) -> float:
+    """Return CPU microseconds per tap for one path."""
+    for section, payload in items:
+        await path(bot, section, payload)
+    started = time.process_time()
+    for _ in range(rounds):
+        for section, payload in items:
+            await path(bot, section, payload)
+    return (time.process_time() - started) / (rounds * len(items)) * 1e6
+
+
+async def run(rounds: int) -> dict:
+    bot, _ = make_fake_bot()
+    await bot.initialize()
+    items = []
+    for language in LANGUAGES:
+        catalog = load_catalog(importlib.import_module(f'{language}.sections'))
+        payloads = build_payloads(catalog)
+        items += [(catalog.sections[data], payloads[data]) for data in catalog.sections]
+
+    generic_us = await measure(generic, bot, items, rounds)
+    prepared_us = await measure(prepared, bot, items, rounds)
+    return {
+        'sections': len(items),
+        'rounds': rounds,
+        'generic_us_per_tap': round(generic_us, 1),
+        'prepared_us_per_tap': round(prepared_us, 1),
+        'saving_percent': round((1 - prepared_us / generic_us) * 100, 1),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rounds', type=int, default=200)
+    args = parser.parse_args()
+    print(json.dumps(asyncio.run(run(args.rounds)), indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Webhook server throughput benchmark.
+
+Runs core.server.WebhookServer in a child process pinned to one CPU core and
+posts realistic callback-query updates to it over keep-alive connections.
+The server decodes every update and puts it on the Application's update queue,
+exactly as in production; handlers are not run. ``--full-decode`` disables the
+core.fastpath views so every update goes through Update.de_json.
+
+Usage:
+    python benchmarks/bench_webhook_server.py [--updates 20000] [--concurrency 64] [--full-decode]
+"""
+
+import os
+import sys
+import json
+import time
+import asyncio
+import argparse
+import subprocess
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from benchmarks.payloads import callback_update
+
+
+async def serve(port: int, fast_path: bool) -> None:
+    """Child process: run the webhook server for one bot and drain its queue."""
+    from telegram.ext import ApplicationBuilder
+    from core import fastpath
+    from core.server import WebhookServer
+
+    if hasattr(os, 'sched_setaffinity'):
+        os.sched_setaffinity(0, {0})
+
+    application = ApplicationBuilder().token('123456:BENCHMARK').build()
+    fastpath.install(application, None, None)
+    server = WebhookServer({'eng': application}, fast_path=fast_path)
+    await server.start(port, host='127.0.0.1')
+
+    async def drain():
+        while True:
+            await application.update_queue.get()
+
+    asyncio.create_task(drain())
+    print('ready', flush=True)
+    await asyncio.Event().wait()
+
+
+async def load(port: int, updates: int, concurrency: int) -> dict:
+    import aiohttp
+
+    url = f'http://127.0.0.1:{port}/webhook/eng'
+    bodies = [json.dumps(callback_update(i, 'faq', user_id=700000000 + i % 5000)).encode()
+              for i in range(min(updates, 5000))]
+    latencies = []
+    counter = iter(range(updates))
+
+    async def worker(session):
+        for i in counter:
+            started = time.perf_counter()
+            async with session.post(url, data=bodies[i % len(bodies)],
+                                    headers={'Content-Type': 'application/json'}) as response:
+                await response.read()
+                if response.status != 200:
+                    raise RuntimeError(f'HTTP {response.status}')
+            latencies.append(time.perf_counter() - started)
+
+    connector = aiohttp.TCPConnector(limit=concurrency)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        started = time.perf_counter()
+        await asyncio.gather(*(worker(session) for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        'updates': updates,
+        'concurrency': concurrency,
+        'seconds': round(elapsed, 3),
+        'updates_per_second': round(updates / elapsed),
+        'p50_ms': round(latencies[len(latencies) // 2] * 1000, 2),
+        'p99_ms': round(latencies[int(len(latencies) * 0.99)] * 1000, 2),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--updates', type=int, default=20000)
+    parser.add_argument('--concurrency', type=int, default=64)
+    parser.add_argument('--port', type=int, default=8790)
+    parser.add_argument('--full-decode', action='store_true', help='decode every update with Update.de_json')
+    parser.add_argument('--serve', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.serve:
+        asyncio.run(serve(args.port, not args.full_decode))
+        return
+
+    command = [sys.executable, __file__, '--serve', '--port', str(args.port)]
+    if args.full_decode:
+        command.append('--full-decode')
+    child = subprocess.Popen(command, stdout=subprocess.PIPE, text=True)
+    try:
+        child.stdout.readline()
+        result = asyncio.run(load(args.port, args.updates, args.concurrency))
+    finally:
+        child.terminate()
+        child.wait()
+
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the Telegram Bot API, for offline end-to-end and load testing.
+
+Implements the subset the bots use (getMe, getUpdates, setWebhook, deleteWebhook,
+sendMessage, sendPhoto, editMessageText, editMessageCaption, deleteMessage,
+answerCallbackQuery) for any token, with
+configurable latency, injected 429 "Too Many Requests" replies and per-method
+request accounting.
+
+Point the bots at it with ``BOT_API_BASE_URL=http://127.0.0.1:8081/bot``.
+Control endpoints:
+
+    POST /control/updates/<token>   queue a JSON update (or a list) for getUpdates
+    GET  /control/stats             request counts, 429s and latencies per method
+    POST /control/reset             clear queued updates and accounting
+
+Usage:
+    python benchmarks/fake_api.py [--port 8081] [--latency-ms 30] [--jitter-ms 10] [--rate-limit 0.01]
+"""
+
+import json
+import time
+import random
+import asyncio
+import logging
+import argparse
+from collections import Counter, defaultdict, deque
+
+from aiohttp import web
+
+logger = logging.getLogger(__name__)
+
+# Big enough for an uploaded logo
+MAX_BODY_SIZE = 20 * 1024 * 1024
+
+
+class FakeBotAPI:
+    """An aiohttp application answering Bot API requests from memory."""
+
+    def __init__(self, latency=0.0, jitter=0.0, rate_limit=0.0, retry_after=1, seed=None):
+        self.latency = latency
+        self.jitter = jitter
+        self.rate_limit = rate_limit
+        self.retry_after = retry_after
+        self._random = random.Random(seed)
+        self.app = web.Application(client_max_size=MAX_BODY_SIZE)
+        self.app.router.add_post('/bot{token}/{method}', self.handle)
+        self.app.router.add_get('/bot{token}/{method}', self.handle)
+        self.app.router.add_post('/control/updates/{token}', self.control_updates)
+        self.app.router.add_get('/control/stats', self.control_stats)
+        self.app.router.add_post('/control/reset', self.control_reset)
+        self._runner = None
+        self.webhooks = {}
+        self._updates = defaultdict(deque)
+        self._update_events = defaultdict(asyncio.Event)
+        self._message_ids = Counter()
+        self.reset()
+
+    def reset(self) -> None:
+        self.calls = Counter()
+        self.rate_limited = Counter()
+        self.latencies = defaultdict(list)
+        self.bytes_received = 0
+        self._updates.clear()
+
+    # ----- Bot API -----
+
+    async def handle(self, request):
+        token = request.match_info['token']
+        method = request.match_info['method']
+        started = time.perf_counter()
+        params = await self._read_params(request)
+        self.calls[method] += 1
+
+        delay = self.latency + (self._random.uniform(0, self.jitter) if self.jitter else 0)
+        if delay and method != 'getUpdates':
+            await asyncio.sleep(delay)
+
+        if self.rate_limit and method != 'getUpdates' and self._random.random() < self.rate_limit:
+            self.rate_limited[method] += 1
+            return web.json_response({
+                'ok': False,
+                'error_code': 429,
+                'description': f'Too Many Requests: retry after {self.retry_after}',
+                'parameters': {'retry_after': self.retry_after},
+            }, status=429)
+
+        handler = getattr(self, f'api_{method}', None)
+        if handler is None:
+            return web.json_response(
+                {'ok': False, 'error_code': 404, 'description': 'Not Found'}, status=404)
+        result = await handler(token, params)
+        self.latencies[method].append(time.perf_counter() - started)
+        return web.json_response({'ok': True, 'result': result})
+
+    async def _read_params(self, request) -> dict:
+        if request.method == 'GET':
+            return dict(request.query)
+        if request.content_type == 'application/json':
+            body = await request.read()
+            self.bytes_received += len(body)
+            return json.loads(body) if body else {}
+        form = await request.post()
+        self.bytes_received += request.content_length or 0
+        params = {}
+        for key, value in form.items():
+            params[key] = value if isinstance(value, str) else value.file.read()
+        return params
+
+    @staticmethod
+    def _bot_user(token: str) -> dict:
+        bot_id = int(token.split(':', 1)[0]) if token.split(':', 1)[0].isdigit() else 1
+        return {'id': bot_id, 'is_bot': True, 'first_name': 'TrustCoin',
+                'username': f'fake_bot_{bot_id}', 'can_join_groups': True,
+                'can_read_all_group_messages': False, 'supports_inline_queries': False}
+
+    def _message(self, token: str, params: dict, message_id=None) -> dict:
+        chat_id = int(params.get('chat_id', 0))
+        if message_id is None:
+            self._message_ids[token, chat_id] += 1
+            message_id = self._message_ids[token, chat_id]
+        message = {
+            'message_id': int(message_id),
+            'from': self._bot_user(token),
+            'chat': {'id': chat_id, 'type': 'private', 'first_name': 'User'},
+            'date': int(time.time()),
+        }
+        if 'text' in params:
+            message['text'] = params['text']
+        if 'reply_markup' in params:
+            markup = params['reply_markup']
+            message['reply_markup'] = json.loads(markup) if isinstance(markup, str) else markup
+        return message
+
+    async def api_getMe(self, token, params):
+        return self._bot_user(token)
+
+    async def api_getUpdates(self, token, params):
+        queue = self._updates[token]
+        offset = int(params.get('offset') or 0)
+        while queue and queue[0]['update_id'] < offset:
+            queue.popleft()
+        if not queue:
+            event = self._update_events[token]
+            event.clear()
+            try:
+                await asyncio.wait_for(event.wait(), float(params.get('timeout') or 0))
+            except asyncio.TimeoutError:
+                pass
+        limit = int(params.get('limit') or 100)
+        return [update for _, update in zip(range(limit), queue) if update['update_id'] >= offset]
+
+    async def api_setWebhook(self, token, params):
+        self.webhooks[token] = params.get('url', '')
+        return True
+
+    async def api_deleteWebhook(self, token, params):
+        self.webhooks.pop(token, None)
+        if str(params.get('drop_pending_updates', '')).lower() in ('true', '1'):
+            self._updates[token].clear()
+        return True
+
+    async def api_sendMessage(self, token, params):
+        return self._message(token, params)
+
+    def _photo_message(self, token: str, params: dict, message_id=None) -> dict:
+        message = self._message(token, params, message_id)
+        message['caption'] = params.get('caption', '')
+        message['photo'] = [{'file_id': f'fake-photo-{token.split(":", 1)[0]}', 'file_unique_id': 'fake-photo',
+                             'width': 800, 'height': 800, 'file_size': 52000}]
+        return message
+
+    async def api_sendPhoto(self, token, params):
+        return self._photo_message(token, params)
+
+    async def api_editMessageText(self, token, params):
+        return self._message(token, params, message_id=params.get('message_id'))
+
+    async def api_editMessageCaption(self, token, params):
+        return self._photo_message(token, params, message_id=params.get('message_id'))
+
+    async def api_deleteMessage(self, token, params):
+        return True
+
+    async def api_answerCallbackQuery(self, token, params):
+        return True
+
+    # ----- control -----
+
+    def enqueue(self, token: str, updates) -> None:
+        """Queue updates to be returned by getUpdates for ``token``."""
+        self._updates[token].extend(updates if isinstance(updates, list) else [updates])
+        self._update_events[token].set()
+
+    async def control_updates(self, request):
+        self.enqueue(request.match_info['token'], await request.json())
+        return web.Response(text='OK')
+
+    def answered(self, method: str) -> int:
+        """Calls of ``method`` answered successfully (not with an injected 429)."""
+        return self.calls[method] - self.rate_limited[method]
+
+    def stats(self) -> dict:
+        latencies = {}
+        for method, samples in self.latencies.items():
+            ordered = sorted(samples)
+            latencies[method] = {
+                'p50_ms': round(ordered[len(ordered) // 2] * 1000, 2),
+                'p99_ms': round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))] * 1000, 2),
+            }
+        return {
+            'calls': dict(self.calls),
+            'rate_limited': dict(self.rate_limited),
+            'latencies': latencies,
+            'bytes_received': self.bytes_received,
+            'webhooks': dict(self.webhooks),
+        }
+
+    async def control_stats(self, request):
+        return web.json_response(self.stats())
+
+    async def control_reset(self, request):
+        self.reset()
+        return web.Response(text='OK')
+
+    async def start(self, port: int, host='127.0.0.1') -> None:
+        self._runner = web.AppRunner(self.app, access_log=None)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, host, port).start()
+        logger.info(f"Fake Bot API listening on http://{host}:{port}/bot")
+
+    async def stop(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8081)
+    parser.add_argument('--latency-ms', type=float, default=0.0, help='added to every call except getUpdates')
+    parser.add_argument('--jitter-ms', type=float, default=0.0, help='random extra latency up to this value')
+    parser.add_argument('--rate-limit', type=float, default=0.0, help='fraction of calls answered with 429')
+    parser.add_argument('--retry-after', type=int, default=1, help='retry_after sent with injected 429s')
+    args = parser.parse_args()
+
+    logging.basicConfig(format='%(asctime)s - %(name)s - %(levelname)s - %(message)s', level=logging.INFO)
+    api = FakeBotAPI(args.latency_ms / 1000, args.jitter_ms / 1000, args.rate_limit, args.retry_after)
+    web.run_app(api.app, host=args.host, port=args.port, access_log=None)
+
+
+if __name__ == '__main__':
+    main()
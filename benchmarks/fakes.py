@@ -0,0 +1,79 @@
+"""
+In-process fakes for benchmarking handlers without network access.
+"""
+
+import json
+import time
+from collections import Counter
+from urllib.parse import urlencode
+
+from telegram import Bot
+from telegram.request import BaseRequest
+
+BOT_USER = {'id': 6000000000, 'is_bot': True, 'first_name': 'TrustCoin', 'username': 'tructcoin_bot'}
+
+
+def _message_result(parameters: dict) -> dict:
+    chat_id = int(parameters.get('chat_id', 1))
+    result = {
+        'message_id': int(parameters.get('message_id', 43)),
+        'from': BOT_USER,
+        'chat': {'id': chat_id, 'type': 'private', 'first_name': 'Benchmark'},
+        'date': int(time.time()),
+    }
+    if 'text' in parameters:
+        result['text'] = parameters['text']
+    if 'caption' in parameters or 'photo' in parameters:
+        result['caption'] = parameters.get('caption', '')
+        result['photo'] = [{'file_id': 'AgACAgQAAxkDAAIBZ2X-fake', 'file_unique_id': 'AQADfake',
+                            'file_size': 52000, 'width': 800, 'height': 800}]
+    if 'reply_markup' in parameters:
+        markup = parameters['reply_markup']
+        result['reply_markup'] = json.loads(markup) if isinstance(markup, str) else markup
+    return result
+
+
+class RecordingRequest(BaseRequest):
+    """A BaseRequest that answers every Bot API call locally and records it.
+
+    Form encoding is still performed, so the measured cost includes everything a
+    real request does on our side except the socket I/O.
+    """
+
+    def __init__(self):
+        self.calls = Counter()
+        self.bytes_sent = 0
+
+    @property
+    def read_timeout(self):
+        return None
+
+    async def initialize(self) -> None:
+        pass
+
+    async def shutdown(self) -> None:
+        pass
+
+    def reset(self) -> None:
+        self.calls.clear()
+        self.bytes_sent = 0
+
+    async def do_request(self, url, method, request_data=None, *args, **kwargs):
+        endpoint = url.rsplit('/', 1)[-1]
+        self.calls[endpoint] += 1
+        parameters = request_data.json_parameters if request_data else {}
+        if request_data is not None and not request_data.contains_files:
+            self.bytes_sent += len(urlencode(parameters))
+        if endpoint == 'getMe':
+            result = BOT_USER
+        elif endpoint in ('sendMessage', 'sendPhoto') or (endpoint.startswith('edit') and 'message_id' in parameters):
+            result = _message_result(parameters)
+        else:
+            result = True
+        return 200, json.dumps({'ok': True, 'result': result}).encode()
+
+
+def make_fake_bot(token='123456:BENCHMARK'):
+    """A Bot wired to a RecordingRequest; returns (bot, request)."""
+    request = RecordingRequest()
+    return Bot(token, request=request, get_updates_request=RecordingRequest()), request
@@ -0,0 +1,63 @@
+"""
+Realistic webhook payloads shared by the benchmark scripts.
+"""
+
+import time
+
+CHAT_ID = 700000000
+
+
+def user(user_id: int) -> dict:
+    return {
+        'id': user_id,
+        'is_bot': False,
+        'first_name': 'Benchmark',
+        'last_name': 'User',
+        'username': f'bench_user_{user_id}',
+        'language_code': 'en',
+    }
+
+
+def start_update(update_id: int, user_id: int = CHAT_ID) -> dict:
+    """A private-chat ``/start`` message as Telegram delivers it."""
+    return {
+        'update_id': update_id,
+        'message': {
+            'message_id': update_id,
+            'from': user(user_id),
+            'chat': {'id': user_id, 'first_name': 'Benchmark', 'username': f'bench_user_{user_id}', 'type': 'private'},
+            'date': int(time.time()),
+            'text': '/start',
+            'entities': [{'offset': 0, 'length': 6, 'type': 'bot_command'}],
+        },
+    }
+
+
+def callback_update(update_id: int, data: str, user_id: int = CHAT_ID, message_id: int = 42,
+                    photo: bool = False) -> dict:
+    """A callback query from an inline button under a bot message."""
+    message = {
+        'message_id': message_id,
+        'from': {'id': 6000000000, 'is_bot': True, 'first_name': 'TrustCoin', 'username': 'tructcoin_bot'},
+        'chat': {'id': user_id, 'first_name': 'Benchmark', 'username': f'bench_user_{user_id}', 'type': 'private'},
+        'date': int(time.time()),
+        'reply_markup': {'inline_keyboard': [[{'text': 'FAQ', 'callback_data': 'faq'}]]},
+    }
+    if photo:
+        message['photo'] = [
+            {'file_id': 'AgACAgQAAxkDAAIBZ2X-small', 'file_unique_id': 'AQADsmall', 'file_size': 1500, 'width': 90, 'height': 90},
+            {'file_id': 'AgACAgQAAxkDAAIBZ2X-large', 'file_unique_id': 'AQADlarge', 'file_size': 52000, 'width': 800, 'height': 800},
+        ]
+        message['caption'] = 'Welcome to TrustCoin (TBN)!'
+    else:
+        message['text'] = 'Main menu:'
+    return {
+        'update_id': update_id,
+        'callback_query': {
+            'id': str(4000000000000000000 + update_id),
+            'from': user(user_id),
+            'message': message,
+            'chat_instance': '-5844719283746512345',
+            'data': data,
+        },
+    }
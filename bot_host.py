@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+"""
+TrustCoin Bot Host - تشغيل جميع البوتات في عملية واحدة
+Runs every language bot in a single process on one event loop.
+
+Usage:
+    python bot_host.py              # every bot with a token in .env
+    python bot_host.py eng fr       # only the selected bots
+"""
+
+import sys
+import logging
+
+# First import: the startup clock starts here
+from core.startup import timer
+
+from dotenv import load_dotenv
+
+# Load environment variables from .env file
+load_dotenv()
+
+# Configure logging
+logging.basicConfig(
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    level=logging.INFO
+)
+# httpx logs every Bot API request at INFO
+logging.getLogger('httpx').setLevel(logging.WARNING)
+
+with timer.phase('import telegram and core'):
+    from core.host import main
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
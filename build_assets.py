@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Asset build step - تحسين صور البوتات
+Writes optimized variants of the images in assets/ to assets/build/.
+
+Every source image gets a recompressed PNG, JPEG and WebP no larger than
+Telegram's photo display size, named after the SHA-256 of the source
+(``logo.<hash>.jpg``), plus an entry in assets/build/manifest.json. The
+smallest PNG/JPEG variant is the one the bots send as a photo; the runtime
+uses it only while its hash matches the source, so a changed logo is never
+replaced by a stale build. Sources that did not change are skipped.
+
+Telegram re-encodes photos to JPEG, so transparency is lost anyway; the JPEG
+variant is flattened onto ``--background``.
+
+Usage:
+    python build_assets.py [--max-side 1280] [--quality 85] [--background ffffff]
+"""
+
+import os
+import sys
+import json
+import hashlib
+import argparse
+from io import BytesIO
+
+from PIL import Image, ImageOps
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+ASSETS_DIR = os.path.join(ROOT_DIR, 'assets')
+BUILD_DIR = os.path.join(ASSETS_DIR, 'build')
+MANIFEST = 'manifest.json'
+SOURCE_EXTENSIONS = ('.png', '.jpg', '.jpeg')
+# Formats Telegram shows as a photo; WebP is built for other uses (web, stickers)
+PHOTO_FORMATS = ('png', 'jpg')
+
+
+def sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def load_manifest(build_dir: str) -> dict:
+    try:
+        with open(os.path.join(build_dir, MANIFEST), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def encode(image: Image.Image, fmt: str, quality: int, background: tuple) -> bytes:
+    out = BytesIO()
+    if fmt == 'jpg':
+        flat = Image.new('RGB', image.size, background)
+        flat.paste(image, mask=image.getchannel('A') if image.mode == 'RGBA' else None)
+        flat.save(out, 'JPEG', quality=quality, optimize=True, progressive=True)
+    elif fmt == 'webp':
+        image.save(out, 'WEBP', quality=quality, method=6)
+    else:
+        image.save(out, 'PNG', optimize=True)
+    return out.getvalue()
+
+
+def build(path: str, build_dir: str, settings: dict, previous) -> dict:
+    """Build the variants of one source image and return its manifest entry."""
+    with open(path, 'rb') as f:
+        source = f.read()
+    digest = sha256(source)
+    if previous and previous['source_sha256'] == digest and previous['settings'] == settings and all(
+            os.path.exists(os.path.join(build_dir, variant['file'])) for variant in previous['variants'].values()):
+        print(f"✅ {os.path.basename(path)} is up to date")
+        return previous
+
+    stem = os.path.splitext(os.path.basename(path))[0]
+    image = ImageOps.exif_transpose(Image.open(path))
+    image = image.convert('RGBA' if 'A' in image.getbands() or 'transparency' in image.info else 'RGB')
+    image.thumbnail((settings['max_side'], settings['max_side']), Image.LANCZOS)
+    background = tuple(int(settings['background'][i:i + 2], 16) for i in (0, 2, 4))
+
+    variants = {}
+    for fmt in ('png', 'jpg', 'webp'):
+        data = encode(image, fmt, settings['quality'], background)
+        name = f"{stem}.{digest[:12]}.{fmt}"
+        with open(os.path.join(build_dir, name), 'wb') as f:
+            f.write(data)
+        variants[fmt] = {'file': name, 'bytes': len(data), 'sha256': sha256(data)}
+
+    photo = min(PHOTO_FORMATS, key=lambda fmt: variants[fmt]['bytes'])
+    sizes = ', '.join(f"{fmt} {variant['bytes']:,}" for fmt, variant in variants.items())
+    print(f"🖼️ {os.path.basename(path)}: {len(source):,} bytes -> {sizes} (photo: {photo})")
+    return {
+        'source_sha256': digest,
+        'source_bytes': len(source),
+        'size': list(image.size),
+        'settings': settings,
+        'variants': variants,
+        'photo': photo,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Build optimized variants of the bot images.')
+    parser.add_argument('--assets-dir', default=ASSETS_DIR)
+    parser.add_argument('--build-dir', default=BUILD_DIR)
+    parser.add_argument('--max-side', type=int, default=1280, help='Telegram shows photos at most 1280 px')
+    parser.add_argument('--quality', type=int, default=85, help='JPEG and WebP quality')
+    parser.add_argument('--background', default='ffffff', help='hex colour behind transparency in JPEG')
+    args = parser.parse_args()
+
+    settings = {'max_side': args.max_side, 'quality': args.quality, 'background': args.background.lower()}
+    os.makedirs(args.build_dir, exist_ok=True)
+    manifest = load_manifest(args.build_dir)
+
+    sources = sorted(
+        name for name in os.listdir(args.assets_dir)
+        if name.lower().endswith(SOURCE_EXTENSIONS) and os.path.isfile(os.path.join(args.assets_dir, name))
+    )
+    if not sources:
+        print(f"❌ No images found in {args.assets_dir}")
+        sys.exit(1)
+    manifest = {
+        name: build(os.path.join(args.assets_dir, name), args.build_dir, settings, manifest.get(name))
+        for name in sources
+    }
+
+    # Variants of older source versions are no longer referenced
+    current = {variant['file'] for entry in manifest.values() for variant in entry['variants'].values()}
+    for name in os.listdir(args.build_dir):
+        if name != MANIFEST and name not in current:
+            os.remove(os.path.join(args.build_dir, name))
+
+    with open(os.path.join(args.build_dir, MANIFEST), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+
+
+if __name__ == "__main__":
+    main()
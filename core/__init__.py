@@ -0,0 +1,4 @@
+"""
+Shared building blocks for the TrustCoin language bots.
+الوحدات المشتركة بين بوتات TrustCoin
+"""
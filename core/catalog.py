@@ -0,0 +1,83 @@
+"""
+Section catalog: menu content loaded once from a language's sections module.
+"""
+
+import json
+from types import MappingProxyType
+from typing import NamedTuple, Optional
+
+from telegram import InlineKeyboardButton, InlineKeyboardMarkup
+
+DEFAULT_PARSE_MODE = "Markdown"
+
+
+class Keyboard(NamedTuple):
+    """A static keyboard built once: its rows, the frozen markup and the markup's JSON."""
+    rows: tuple
+    markup: InlineKeyboardMarkup
+    json: str
+
+
+class Section(NamedTuple):
+    """What a tap renders: the text, its parse mode and the keyboard under it."""
+    text: str
+    parse_mode: Optional[str]
+    keyboard: Keyboard
+
+
+class Catalog(NamedTuple):
+    """Immutable content of one language: callback_data -> Section, plus /start, fallback
+    and the toast shown for taps over the rate limit."""
+    sections: MappingProxyType
+    welcome: Section
+    fallback: Section
+    throttled: str
+
+
+def _freeze_keyboard(rows) -> Keyboard:
+    rows = tuple(tuple((label, value) for label, value in row) for row in rows)
+    # Telegram objects are immutable once built, so one markup serves every request
+    markup = build_keyboard(rows)
+    return Keyboard(rows, markup, json.dumps(markup.to_dict(), ensure_ascii=False, separators=(',', ':')))
+
+
+def _section(spec: dict, keyboards: dict) -> Section:
+    name = spec["keyboard"]
+    if name not in keyboards:
+        raise ValueError(f"❌ Unknown keyboard '{name}' in sections")
+    return Section(spec["text"], spec.get("parse_mode", DEFAULT_PARSE_MODE), keyboards[name])
+
+
+def load_catalog(module) -> Catalog:
+    """Build a Catalog from a sections module (WELCOME_TEXT, KEYBOARDS, SECTIONS, FALLBACK, THROTTLED).
+
+    Every callback button must point at a known section, so a typo fails at startup
+    instead of silently showing the fallback.
+    """
+    keyboards = {name: _freeze_keyboard(rows) for name, rows in module.KEYBOARDS.items()}
+    sections = {data: _section(spec, keyboards) for data, spec in module.SECTIONS.items()}
+
+    for name, keyboard in keyboards.items():
+        for row in keyboard.rows:
+            for label, value in row:
+                if "://" not in value and value not in sections:
+                    raise ValueError(f"❌ Button '{label}' in keyboard '{name}' points to unknown section '{value}'")
+
+    return Catalog(
+        sections=MappingProxyType(sections),
+        welcome=Section(module.WELCOME_TEXT, DEFAULT_PARSE_MODE, keyboards["main"]),
+        fallback=_section(module.FALLBACK, keyboards),
+        throttled=module.THROTTLED,
+    )
+
+
+def build_keyboard(rows) -> InlineKeyboardMarkup:
+    """Turn keyboard rows of (label, value) pairs into an InlineKeyboardMarkup."""
+    return InlineKeyboardMarkup([
+        [
+            InlineKeyboardButton(label, url=value) if "://" in value
+            else InlineKeyboardButton(label, callback_data=value)
+            for label, value in row
+        ]
+        for row in rows
+    ])
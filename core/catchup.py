@@ -0,0 +1,79 @@
+"""
+Backlog catch-up: handle the updates that arrived while a polling bot was down.
+"""
+
+import os
+import time
+import logging
+
+from core.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+# The most getUpdates returns per call
+BATCH_SIZE = 100
+
+
+def catch_up_enabled() -> bool:
+    """Opt-in with env ``CATCH_UP_PENDING=1``; otherwise pending updates are dropped on start."""
+    return os.getenv('CATCH_UP_PENDING', '').lower() in ('1', 'true', 'yes')
+
+
+def tap_key(update):
+    """The (chat, message) a callback query tapped, or None for every other update."""
+    query = update.callback_query
+    if query is None:
+        return None
+    if query.message is not None:
+        return query.message.chat_id, query.message.message_id
+    return query.inline_message_id
+
+
+def coalesce(updates: list) -> list:
+    """Keep only the latest tap on each message; every other update is kept, in order.
+
+    Taps made while the bot was down navigated a menu one after another. Only
+    the last one decides what the message should show, so replaying the earlier
+    ones would just edit it several times over.
+    """
+    keys = [tap_key(update) for update in updates]
+    # Later taps overwrite earlier ones
+    latest = {key: update.update_id for key, update in zip(keys, updates) if key is not None}
+    return [update for key, update in zip(keys, updates) if key is None or latest[key] == update.update_id]
+
+
+async def fetch_backlog(bot) -> list:
+    """Fetch every pending update in full batches and confirm them with Telegram."""
+    updates = []
+    offset = None
+    while True:
+        batch = await bot.get_updates(offset=offset, limit=BATCH_SIZE, timeout=0)
+        if not batch:
+            # This call's offset confirmed everything fetched before it
+            return updates
+        updates.extend(batch)
+        offset = batch[-1].update_id + 1
+
+
+async def catch_up(name: str, application) -> int:
+    """Queue the coalesced backlog of ``application`` before it starts; return how many were queued.
+
+    Call it after ``initialize()`` and before polling and ``start()``. The queued
+    updates then go through the update processor at its full concurrency, each
+    chat's in order.
+    """
+    started = time.perf_counter()
+    # getUpdates is refused while a webhook is set (the bot ran in webhook mode before)
+    await application.bot.delete_webhook(drop_pending_updates=False)
+    updates = await fetch_backlog(application.bot)
+    survivors = coalesce(updates)
+    for update in survivors:
+        application.update_queue.put_nowait(update)
+    labels = (('bot', name),)
+    metrics.inc('catch_up_updates_total', labels + (('outcome', 'queued'),), len(survivors))
+    metrics.inc('catch_up_updates_total', labels + (('outcome', 'coalesced'),), len(updates) - len(survivors))
+    if updates:
+        logger.info(f"🔄 Bot '{name}': caught up {len(updates)} pending update(s), queued {len(survivors)}, "
+                    f"dropped {len(updates) - len(survivors)} superseded tap(s) "
+                    f"({(time.perf_counter() - started) * 1000:.0f} ms)")
+    return len(survivors)
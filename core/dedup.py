@@ -0,0 +1,58 @@
+"""
+Bounded update_id deduplication for webhook deliveries.
+"""
+
+_UPDATE_ID_PREFIX = b'{"update_id":'
+
+
+class UpdateWindow:
+    """The last ``size`` update_ids of one bot: a ring buffer plus an id -> slot map, fixed memory.
+
+    Telegram re-delivers a webhook update when our response is slow or fails, and
+    overlapping replicas can both receive it; ``seen`` returns True for the copies.
+    """
+
+    __slots__ = ('_ring', '_ids', '_next')
+
+    def __init__(self, size: int):
+        self._ring = [None] * size
+        self._ids = {}
+        self._next = 0
+
+    def seen(self, update_id: int) -> bool:
+        """Record ``update_id``; return True if it is already in the window."""
+        if update_id in self._ids:
+            return True
+        evicted = self._ring[self._next]
+        if evicted is not None:
+            del self._ids[evicted]
+        self._ring[self._next] = update_id
+        self._ids[update_id] = self._next
+        self._next = (self._next + 1) % len(self._ring)
+        return False
+
+    def forget(self, update_id: int) -> None:
+        """Let a later delivery of ``update_id`` through (its processing failed)."""
+        slot = self._ids.pop(update_id, None)
+        if slot is not None:
+            # Its slot must not evict the id once a retry records it again
+            self._ring[slot] = None
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+
+def peek_update_id(body: bytes):
+    """Read the update_id from the start of a webhook body without parsing it.
+
+    Telegram serializes ``update_id`` first; returns None for any other layout.
+    """
+    if not body.startswith(_UPDATE_ID_PREFIX):
+        return None
+    end = body.find(b',', len(_UPDATE_ID_PREFIX), 32)
+    if end == -1:
+        return None
+    try:
+        return int(body[len(_UPDATE_ID_PREFIX):end])
+    except ValueError:
+        return None
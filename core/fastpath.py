@@ -0,0 +1,109 @@
+"""
+Fast path for webhook updates: decode taps and /start without building telegram objects.
+
+``decode`` turns the two update shapes these bots live on into small ``__slots__``
+views (:class:`CallbackView`, :class:`StartView`) that carry only what the handlers
+read. Anything else returns None and goes through ``Update.de_json`` as before.
+The views are put on the Application's update queue like any update and reach
+the regular ``start``/``button_handler`` callbacks through :func:`install`.
+"""
+
+import json
+
+from telegram.ext import TypeHandler
+
+try:
+    import orjson
+    loads = orjson.loads
+except ImportError:  # optional speed-up
+    loads = json.loads
+
+
+class MessageRef:
+    """The parts of a Message the handlers use."""
+
+    __slots__ = ('chat_id', 'message_id', 'photo')
+
+    def __init__(self, chat_id: int, message_id: int, photo: bool):
+        self.chat_id = chat_id
+        self.message_id = message_id
+        self.photo = photo
+
+
+class CallbackView:
+    """A callback query update, usable where handlers expect ``update.callback_query``."""
+
+    __slots__ = ('update_id', 'id', 'data', 'user_id', 'message', '_bot')
+
+    callback_query = property(lambda self: self)
+
+    def __init__(self, update_id: int, query_id: str, data: str, user_id: int, message: MessageRef, bot):
+        self.update_id = update_id
+        self.id = query_id
+        self.data = data
+        self.user_id = user_id
+        self.message = message
+        self._bot = bot
+
+    async def answer(self, **kwargs):
+        return await self._bot.answer_callback_query(self.id, **kwargs)
+
+
+class StartView:
+    """A ``/start`` command update, usable where handlers expect ``update.message``."""
+
+    __slots__ = ('update_id', 'user_id', 'message')
+
+    callback_query = None
+
+    def __init__(self, update_id: int, user_id: int, message: MessageRef):
+        self.update_id = update_id
+        self.user_id = user_id
+        self.message = message
+
+
+def view(data: dict, bot):
+    """Return a view for a plain callback query or ``/start`` update, else None."""
+    if len(data) != 2:
+        return None
+    query = data.get('callback_query')
+    if query is not None:
+        message = query.get('message')
+        callback_data = query.get('data')
+        if message is None or callback_data is None or 'game_short_name' in query:
+            return None
+        return CallbackView(
+            data['update_id'],
+            query['id'],
+            callback_data,
+            query['from']['id'],
+            MessageRef(message['chat']['id'], message['message_id'], 'photo' in message),
+            bot,
+        )
+    message = data.get('message')
+    if message is not None:
+        text = message.get('text')
+        if text == '/start' or (text and text.startswith('/start ')):
+            return StartView(
+                data['update_id'],
+                message['from']['id'] if 'from' in message else None,
+                MessageRef(message['chat']['id'], message['message_id'], False),
+            )
+    return None
+
+
+def install(application, start, button_handler) -> None:
+    """Route fast-path views of ``application`` to its ``start`` and ``button_handler``."""
+    application.add_handlers([
+        TypeHandler(StartView, start),
+        TypeHandler(CallbackView, button_handler),
+    ])
+
+
+def accepts_views(application) -> bool:
+    """Whether :func:`install` was called for ``application``."""
+    return any(
+        isinstance(handler, TypeHandler) and handler.type is CallbackView
+        for handlers in application.handlers.values()
+        for handler in handlers
+    )
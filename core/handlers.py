@@ -0,0 +1,166 @@
+"""
+Telegram handlers shared by every language bot, driven by its section catalog.
+"""
+
+import os
+import math
+import time
+import logging
+
+from telegram.error import BadRequest
+
+from core.media import media_registry
+from core.metrics import metrics
+from core.payloads import (
+    SectionPayload,
+    SentContent,
+    build_caption_payloads,
+    build_payloads,
+    send_prepared,
+)
+from core.throttle import TapThrottle
+
+logger = logging.getLogger(__name__)
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+LOGO_PATH = os.path.join(ROOT_DIR, 'assets', 'logo.png')
+
+
+async def send_or_edit_section(bot, message, payload, caption, sent_content):
+    """Show a section in place of the tapped message.
+
+    Text messages are edited. Under the welcome photo the caption is replaced
+    with ``caption``; a section too long for a caption (``caption`` is None) is
+    sent as a text message that replaces the photo message. The edit is skipped
+    when ``sent_content`` shows the message already displays this payload.
+    """
+    chat_id = message.chat_id
+    message_id = message.message_id
+    if message.photo:
+        if caption is None:
+            return await replace_with_text(bot, message, payload, sent_content)
+        method, payload = 'editMessageCaption', caption
+    else:
+        method = 'editMessageText'
+
+    labels = (('bot', metrics.bot_name(bot)),)
+    if sent_content.matches(chat_id, message_id, payload.digest):
+        metrics.inc('edit_cache_hits_total', labels)
+        return None
+    metrics.inc('edit_cache_misses_total', labels)
+    try:
+        result = await send_prepared(bot, method, payload, chat_id=chat_id, message_id=message_id)
+    except BadRequest as e:
+        # Shown before we started tracking it (e.g. after a restart)
+        if 'message is not modified' not in str(e).lower():
+            raise
+        result = None
+    sent_content.remember(chat_id, message_id, payload.digest)
+    return result
+
+
+async def replace_with_text(bot, message, payload, sent_content):
+    """Send ``payload`` as a text message, then delete the photo message it replaces."""
+    result = await send_prepared(bot, 'sendMessage', payload, chat_id=message.chat_id)
+    if isinstance(result, dict):
+        sent_content.remember(message.chat_id, result['message_id'], payload.digest)
+    try:
+        await bot.delete_message(chat_id=message.chat_id, message_id=message.message_id)
+    except BadRequest as e:
+        # Older than 48 hours or already deleted: leave it in the chat
+        logger.info(f"Could not delete message {message.message_id} in chat {message.chat_id}: {e}")
+    return result
+
+
+async def answer_tap(query, **kwargs) -> None:
+    """Stop the button's loading spinner; a tap from before a restart is too old to answer."""
+    try:
+        await query.answer(**kwargs)
+    except BadRequest as e:
+        if 'query is too old' not in str(e).lower() and 'query id is invalid' not in str(e).lower():
+            raise
+        # One per tap in a caught-up backlog
+        logger.debug(f"Tap {query.id} expired before it was answered, showing the section anyway")
+
+
+def tap_user(query) -> int:
+    """The user who tapped: fast-path views carry the id, CallbackQuery the User."""
+    user_id = getattr(query, 'user_id', None)
+    return user_id if user_id is not None else query.from_user.id
+
+
+def make_handlers(catalog, logo_path=LOGO_PATH, throttle=None):
+    """Return the ``start`` and ``button_handler`` callbacks for one language's catalog.
+
+    Taps go through ``throttle`` (a :class:`~core.throttle.TapThrottle` from the environment by default).
+    """
+    # Section replies are encoded once; a tap only adds chat_id/message_id
+    payloads = build_payloads(catalog)
+    captions = build_caption_payloads(catalog)
+    fallback = SectionPayload(catalog.fallback)
+    fallback_caption = SectionPayload(catalog.fallback, 'caption')
+    welcome_caption = SectionPayload(catalog.welcome, 'caption')
+    try:
+        # Read once here; the handler only sends bytes already in memory
+        logo = media_registry.preload(logo_path)
+    except FileNotFoundError:
+        logger.warning(f"⚠️ Logo not found at {logo_path}, /start will send text only")
+        logo = None
+    # What each message of this bot currently shows, to skip no-op edits
+    sent_content = SentContent()
+    # Taps per user; over the limit a tap only gets a toast
+    throttle = throttle or TapThrottle()
+    # Telegram clients may reuse the toast until the next tap would be allowed
+    throttled_cache_time = max(1, math.ceil(1 / throttle.rate))
+
+    async def start(update, context) -> None:
+        """Handle the /start command by showing the main menu."""
+        started = time.perf_counter()
+        welcome = catalog.welcome
+        chat_id = update.message.chat_id
+        try:
+            if logo is not None:
+                # Uploaded once per bot, then re-sent by its cached Telegram file_id
+                sent = await media_registry.send_photo(
+                    context.bot,
+                    chat_id,
+                    logo,
+                    caption=welcome.text,
+                    reply_markup=welcome.keyboard.markup,
+                    parse_mode=welcome.parse_mode
+                )
+                if getattr(sent, 'message_id', None):
+                    sent_content.remember(chat_id, sent.message_id, welcome_caption.digest)
+            else:
+                # Fallback to text message if logo not found
+                await context.bot.send_message(
+                    chat_id,
+                    welcome.text,
+                    reply_markup=welcome.keyboard.markup,
+                    parse_mode=welcome.parse_mode
+                )
+        finally:
+            labels = (('bot', metrics.bot_name(context.bot)), ('handler', 'start'), ('section', 'welcome'))
+            metrics.observe('handler_seconds', labels, time.perf_counter() - started)
+
+    async def button_handler(update, context) -> None:
+        """Handle all callback queries from inline keyboards."""
+        query = update.callback_query
+        if not throttle.allow(tap_user(query)):
+            metrics.inc('taps_throttled_total', (('bot', metrics.bot_name(context.bot)),))
+            await answer_tap(query, text=catalog.throttled, cache_time=throttled_cache_time)
+            return
+        started = time.perf_counter()
+        if query.data in payloads:
+            section = query.data
+            payload, caption = payloads[section], captions.get(section)
+        else:
+            section, payload, caption = 'fallback', fallback, fallback_caption
+        try:
+            await answer_tap(query)
+            await send_or_edit_section(context.bot, query.message, payload, caption, sent_content)
+        finally:
+            labels = (('bot', metrics.bot_name(context.bot)), ('handler', 'button'), ('section', section))
+            metrics.observe('handler_seconds', labels, time.perf_counter() - started)
+
+    return start, button_handler
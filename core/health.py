@@ -0,0 +1,79 @@
+"""
+Liveness and readiness state reported on ``/health`` and ``/ready``.
+"""
+
+import os
+import time
+import asyncio
+
+# Readiness fails while a bot has more updates than this waiting in its queue
+MAX_QUEUE = int(os.getenv('READY_MAX_QUEUE', 1000))
+# A failed Bot API call stops counting after this long, so an idle webhook bot recovers
+API_ERROR_SECONDS = float(os.getenv('READY_API_ERROR_SECONDS', 60))
+
+
+class HealthState:
+    """When each bot last got an answer from the Bot API, and when a call last failed.
+
+    Recorded by :class:`~core.http.SharedHTTPXRequest` for every call, including
+    long-polling getUpdates, so an idle polling bot stays fresh.
+    """
+
+    def __init__(self):
+        self.started = time.monotonic()
+        self.last_api_ok = {}
+        self.last_api_error = {}
+
+    def api_ok(self, bot: str) -> None:
+        self.last_api_ok[bot] = time.monotonic()
+
+    def api_error(self, bot: str) -> None:
+        self.last_api_error[bot] = time.monotonic()
+
+    def api_reachable(self, bot: str, now=None) -> bool:
+        """False while the latest call of ``bot`` failed (network error or 5xx) less than
+        ``API_ERROR_SECONDS`` ago.
+
+        A webhook bot without traffic makes no calls that could clear an error, so
+        errors expire instead of keeping the bot unready indefinitely.
+        """
+        error = self.last_api_error.get(bot)
+        if error is None or error <= self.last_api_ok.get(bot, float('-inf')):
+            return True
+        now = time.monotonic() if now is None else now
+        return now - error >= API_ERROR_SECONDS
+
+
+async def loop_lag() -> float:
+    """Seconds the event loop took to come back to this task: its current backlog."""
+    started = time.perf_counter()
+    await asyncio.sleep(0)
+    return time.perf_counter() - started
+
+
+def _age(now: float, moment):
+    return round(now - moment, 3) if moment is not None else None
+
+
+def bot_status(name: str, application, webhook_url=None, webhook_registered=False) -> dict:
+    """Readiness of one bot: running, receiving updates, reaching the Bot API, not backlogged."""
+    now = time.monotonic()
+    processor = application.update_processor
+    status = {
+        'running': application.running,
+        'mode': 'webhook' if webhook_url else 'polling',
+        'receiving': webhook_registered if webhook_url else bool(application.updater and application.updater.running),
+        'api_reachable': health.api_reachable(name),
+        'last_api_ok_s': _age(now, health.last_api_ok.get(name)),
+        'last_api_error_s': _age(now, health.last_api_error.get(name)),
+        'update_queue': application.update_queue.qsize(),
+        'updates_in_flight': getattr(processor, 'in_flight', None),
+        'updates_waiting': getattr(processor, 'waiting', None),
+    }
+    status['ready'] = (status['running'] and status['receiving'] and status['api_reachable']
+                       and status['update_queue'] <= MAX_QUEUE)
+    return status
+
+
+# Shared by every bot in the process
+health = HealthState()
@@ -0,0 +1,257 @@
+"""
+Multi-bot host: run several language bots in one process on one asyncio loop.
+"""
+
+import os
+import time
+import signal
+import asyncio
+import logging
+import importlib
+
+from telegram.ext import TypeHandler
+
+from core.catchup import catch_up, catch_up_enabled
+from core.health import bot_status
+from core.http import SharedHTTPXRequest
+from core.loopmon import loop_monitor
+from core.metrics import metrics
+from core.scheduler import OutboundScheduler
+from core.startup import timer
+
+logger = logging.getLogger(__name__)
+
+# Bot name -> (package directory, token environment variable)
+BOT_SPECS = {
+    'eng': ('ENGLISH', 'BOT_TOKEN_ENG'),
+    'ara': ('ARABIC', 'BOT_TOKEN_ARA'),
+    'fr': ('FRANCE', 'BOT_TOKEN_FR'),
+}
+
+
+def load_bot_module(name: str):
+    """Import the bot.py module of a language bot by its short name."""
+    directory, _ = BOT_SPECS[name]
+    return importlib.import_module(f'{directory}.bot')
+
+
+class BotHost:
+    """Start any number of bot Applications on a shared loop and connection pool.
+
+    The webhook server runs on the same loop; webhook updates are routed by
+    path (``/webhook/<bot>``) straight onto each Application's update queue.
+    It is imported and started while the bots initialize, so aiohttp is not
+    loaded before the first Bot API call goes out.
+    """
+
+    def __init__(self, pool_size=None, home_text='TrustCoin Bot host is running!', drain_timeout=None):
+        pool_size = pool_size or int(os.getenv('POOL_SIZE', 16))
+        # Seconds stop() waits for updates already taken before abandoning them
+        self.drain_timeout = drain_timeout or float(os.getenv('DRAIN_TIMEOUT', 8))
+        self.draining = False
+        self.applications = {}
+        self.webhook_urls = {}
+        # Bots whose setWebhook succeeded
+        self.webhooks_registered = set()
+        # Flood limits are enforced per bot token across everything this host sends
+        self.scheduler = OutboundScheduler()
+        # One pool for regular API calls, one for long-polling getUpdates
+        self.request = SharedHTTPXRequest(connection_pool_size=pool_size, scheduler=self.scheduler)
+        self.get_updates_request = SharedHTTPXRequest(connection_pool_size=len(BOT_SPECS) + 1, pool='updates')
+        self.home_text = home_text
+        self.server = None
+        self._stop_event = None
+
+    def add_bot(self, name: str, module=None, token=None) -> None:
+        """Build a bot's Application from its module and register it under ``name``."""
+        module = module or load_bot_module(name)
+        self.add_application(name, module.build_application(
+            token,
+            request=self.request,
+            get_updates_request=self.get_updates_request,
+        ))
+
+    def add_application(self, name: str, application, webhook_url=None) -> None:
+        """Register an already built Application; ``webhook_url`` selects webhook mode for it."""
+        self.applications[name] = application
+        metrics.register_bot(name, application)
+        # Group -1 runs before the bot's own handlers and does not stop them
+        application.add_handler(TypeHandler(object, metrics.count_update), group=-1)
+        # Group 1 runs after them: the first update handled is the first reply
+        application.add_handler(TypeHandler(object, self._first_reply), group=1)
+        if webhook_url:
+            self.webhook_urls[name] = webhook_url
+
+    async def _first_reply(self, update, context) -> None:
+        timer.first_reply()
+
+    async def start_server(self, port: int) -> None:
+        """Import and start the web server; the import runs in a thread so the loop keeps going."""
+        with timer.phase('web server'):
+            server = await asyncio.to_thread(importlib.import_module, 'core.server')
+            self.server = server.WebhookServer(self.applications, self.home_text, readiness=self.readiness)
+            await self.server.start(port)
+
+    async def start(self, webhook_base_url=None, port=None) -> None:
+        """Start the web server and initialize every Application, then start webhook or polling mode.
+
+        Polling bots do not wait for the web server; webhook bots need it before Telegram can deliver.
+        """
+        loop_monitor.start()
+        server = asyncio.ensure_future(self.start_server(port)) if port else None
+        with timer.phase('initialize bots'):
+            await asyncio.gather(*(app.initialize() for app in self.applications.values()))
+
+        if webhook_base_url:
+            webhook_base_url = webhook_base_url.rstrip('/')
+            for name in self.applications:
+                self.webhook_urls.setdefault(name, f"{webhook_base_url}/webhook/{name}")
+        if server is not None and self.webhook_urls:
+            await server
+
+        with timer.phase('set webhooks / start polling'):
+            await asyncio.gather(*(
+                self._set_webhook(name, app) if name in self.webhook_urls
+                else self._start_polling(name, app)
+                for name, app in self.applications.items()
+            ))
+
+        for name, app in self.applications.items():
+            await app.start()
+            logger.info(f"✅ Bot '{name}' started as @{app.bot.username}")
+        if server is not None:
+            await server
+        timer.mark('ready')
+        timer.log_report()
+
+    async def _start_polling(self, name: str, app) -> None:
+        """Start polling; with catch-up on, the backlog is queued first instead of dropped."""
+        if catch_up_enabled():
+            await catch_up(name, app)
+            await app.updater.start_polling(drop_pending_updates=False)
+        else:
+            await app.updater.start_polling(drop_pending_updates=True)
+
+    async def _set_webhook(self, name: str, app) -> None:
+        if await app.bot.set_webhook(url=self.webhook_urls[name]):
+            self.webhooks_registered.add(name)
+
+    def readiness(self):
+        """Whether every bot is ready, and the status of each (see :func:`core.health.bot_status`)."""
+        bots = {
+            name: bot_status(name, app, self.webhook_urls.get(name), name in self.webhooks_registered)
+            for name, app in self.applications.items()
+        }
+        return not self.draining and bool(bots) and all(bot['ready'] for bot in bots.values()), bots
+
+    async def stop(self) -> None:
+        """Shut down within ``drain_timeout`` seconds without dropping updates already taken.
+
+        New webhook deliveries are refused and polling stops first; updates already
+        queued or running get until the deadline to finish, including the sends they
+        are waiting on in the outbound scheduler. Whatever is left is abandoned.
+        Then the web server stops and every Application is shut down, which closes
+        the shared connection pools.
+        """
+        self.draining = True
+        if self.server is not None:
+            self.server.accepting = False
+        await asyncio.gather(*(
+            app.updater.stop() for app in self.applications.values() if app.updater and app.updater.running
+        ))
+
+        running = {name: app for name, app in self.applications.items() if app.running}
+        started = time.monotonic()
+        before = {name: self._completed(app) for name, app in running.items()}
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(*(self._drain(app) for app in running.values())), self.drain_timeout)
+        except asyncio.TimeoutError:
+            pass
+        for name, app in running.items():
+            abandoned = self._abandon(app)
+            drained = self._completed(app) - before[name]
+            log = logger.warning if abandoned else logger.info
+            log(f"🛑 Bot '{name}': drained {drained} update(s), abandoned {abandoned} "
+                f"({time.monotonic() - started:.2f}s)")
+            await app.stop()
+
+        if self.server is not None:
+            await self.server.stop()
+        for app in self.applications.values():
+            await app.shutdown()
+        await loop_monitor.stop()
+
+    @staticmethod
+    def _completed(app) -> int:
+        return getattr(app.update_processor, 'completed', 0)
+
+    @staticmethod
+    async def _drain(app) -> None:
+        # Queued updates are handed to the processor, then handled there
+        await app.update_queue.join()
+        join = getattr(app.update_processor, 'join', None)
+        if join is not None:
+            await join()
+
+    @staticmethod
+    def _abandon(app) -> int:
+        """Drop the updates of ``app`` that are still queued or running; return how many."""
+        dropped = 0
+        while not app.update_queue.empty():
+            app.update_queue.get_nowait()
+            app.update_queue.task_done()
+            dropped += 1
+        abandon = getattr(app.update_processor, 'abandon', None)
+        return dropped + (abandon() if abandon is not None else 0)
+
+    def request_stop(self) -> None:
+        if self._stop_event is not None:
+            self._stop_event.set()
+
+    async def run(self, webhook_base_url=None, port=None) -> None:
+        """Run until SIGINT/SIGTERM."""
+        self._stop_event = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, self.request_stop)
+            except NotImplementedError:
+                # Windows: fall back to KeyboardInterrupt
+                pass
+
+        try:
+            await self.start(webhook_base_url, port)
+            await self._stop_event.wait()
+        finally:
+            logger.info("🛑 Stopping all bots...")
+            await self.stop()
+
+
+def main(names=None) -> None:
+    """Run the selected bots (default: every bot with a configured token)."""
+    names = names or [n.strip() for n in os.getenv('BOTS', ','.join(BOT_SPECS)).split(',') if n.strip()]
+
+    with timer.phase('connection pools'):
+        host = BotHost()
+    for name in names:
+        if name not in BOT_SPECS:
+            raise ValueError(f"❌ Unknown bot '{name}'. Choose from: {', '.join(BOT_SPECS)}")
+        token = os.getenv(BOT_SPECS[name][1])
+        if not token:
+            logger.warning(f"⚠️ {BOT_SPECS[name][1]} not set, skipping '{name}' bot")
+            continue
+        with timer.phase(f'build {name} bot'):
+            host.add_bot(name, token=token)
+
+    if not host.applications:
+        raise ValueError("❌ No bot tokens found in environment variables. Please check your .env file.")
+
+    webhook_base_url = os.getenv('WEBHOOK_BASE_URL')
+    mode = 'webhook' if webhook_base_url else 'polling'
+    logger.info(f"Starting {len(host.applications)} bot(s) in {mode} mode: {', '.join(host.applications)}")
+    try:
+        # Always start the web server for render.com compatibility
+        asyncio.run(host.run(webhook_base_url, port=int(os.getenv('PORT', 8443))))
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,216 @@
+"""
+Outbound HTTP for the Bot API: request objects that several bots can share.
+"""
+
+import os
+import json
+import time
+import asyncio
+import logging
+import functools
+import contextvars
+import importlib.util
+
+import httpx
+from telegram.request import BaseRequest, HTTPXRequest
+
+from core.health import health
+from core.metrics import metrics
+from core.scheduler import LIMITED_METHODS
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BASE_URL = 'https://api.telegram.org/bot'
+
+def api_base_url() -> str:
+    """Bot API base URL; set ``BOT_API_BASE_URL`` to use a local stand-in or self-hosted server."""
+    return os.getenv('BOT_API_BASE_URL') or DEFAULT_BASE_URL
+
+
+# Bot API methods that Telegram accepts as a reply in the webhook response body
+INLINE_METHODS = frozenset({
+    'answerCallbackQuery',
+    'sendMessage',
+    'sendPhoto',
+    'editMessageText',
+    'editMessageCaption',
+    'editMessageReplyMarkup',
+})
+
+# The same reply PTB would parse from a successful edit or answer
+_INLINE_RESULT = b'{"ok":true,"result":true}'
+
+# Read timeouts (seconds) per Bot API method; uploads wait longer for Telegram's answer
+DEFAULT_METHOD_TIMEOUTS = {
+    'sendPhoto': 20.0,
+    'answerCallbackQuery': 5.0,
+}
+
+
+def parse_method_timeouts(value: str) -> dict:
+    """Parse ``HTTP_TIMEOUTS`` (``sendPhoto=30,answerCallbackQuery=3``) into {method: seconds}."""
+    timeouts = {}
+    for item in filter(None, (part.strip() for part in value.split(','))):
+        method, _, seconds = item.partition('=')
+        try:
+            timeouts[method.strip()] = float(seconds)
+        except ValueError:
+            logger.warning(f"⚠️ Ignoring invalid HTTP_TIMEOUTS entry: {item!r}")
+    return timeouts
+
+
+@functools.lru_cache(maxsize=None)
+def _ssl_context():
+    # Loading the CA bundle is the slow part of building a client; do it once per process
+    return httpx.create_ssl_context()
+
+
+def _http_version(requested: str) -> str:
+    if requested in ('2', '2.0') and importlib.util.find_spec('h2') is None:
+        logger.warning("⚠️ HTTP/2 needs the h2 package (pip install 'httpx[http2]'); using HTTP/1.1")
+        return '1.1'
+    return requested
+
+
+# 429 replies are retried this many times if Telegram asks to wait at most MAX_RETRY_AFTER seconds
+MAX_RETRIES = 3
+MAX_RETRY_AFTER = 30
+
+
+def _retry_after(payload: bytes):
+    try:
+        return json.loads(payload)['parameters']['retry_after']
+    except (ValueError, KeyError, TypeError):
+        return None
+
+
+class InlineReply:
+    """Holds the single Bot API call that is answered in a webhook HTTP response."""
+
+    __slots__ = ('method', 'parameters')
+
+    def __init__(self):
+        self.method = None
+        self.parameters = None
+
+    def as_body(self) -> dict:
+        return {'method': self.method, **self.parameters}
+
+
+# Set by the webhook server while it processes an update in inline reply mode
+inline_reply = contextvars.ContextVar('inline_reply', default=None)
+
+
+class SharedHTTPXRequest(HTTPXRequest):
+    """HTTPXRequest whose connection pool can be shared by several Bot instances.
+
+    Every Application initializes and shuts down its bot's request object. The
+    underlying client is only closed when the last bot using it shuts down.
+
+    While an :class:`InlineReply` is active for the current update, the first
+    eligible call without file uploads is captured instead of sent, so the
+    webhook server can return it in the HTTP response.
+
+    With a :class:`~core.scheduler.OutboundScheduler`, message-producing calls wait
+    for the bot's and the chat's rate budget, and calls answered with 429 are
+    retried after the requested delay instead of failing.
+
+    Every call is counted and timed per bot and method in :mod:`core.metrics`, and
+    every new connection is counted per ``pool`` to show how well keep-alive works.
+
+    Defaults come from the environment: ``HTTP_VERSION`` (``1.1`` or ``2``; HTTP/2
+    falls back to 1.1 without the ``h2`` package), ``HTTP_KEEPALIVE_EXPIRY`` (seconds
+    an idle connection is kept), ``HTTP_POOL_TIMEOUT`` (seconds to wait for a free
+    connection) and ``HTTP_TIMEOUTS`` (read timeouts per method, merged over
+    :data:`DEFAULT_METHOD_TIMEOUTS`).
+    """
+
+    def __init__(self, connection_pool_size=1, *, scheduler=None, pool='api', http_version=None,
+                 keepalive_expiry=None, method_timeouts=None, **kwargs):
+        self.pool = pool
+        self.keepalive_expiry = keepalive_expiry or float(os.getenv('HTTP_KEEPALIVE_EXPIRY', 30))
+        kwargs.setdefault('pool_timeout', float(os.getenv('HTTP_POOL_TIMEOUT', 5)))
+        http_version = _http_version(http_version or os.getenv('HTTP_VERSION', '1.1'))
+        super().__init__(connection_pool_size, http_version=http_version, **kwargs)
+        self.scheduler = scheduler
+        if method_timeouts is None:
+            method_timeouts = {**DEFAULT_METHOD_TIMEOUTS, **parse_method_timeouts(os.getenv('HTTP_TIMEOUTS', ''))}
+        self.method_timeouts = method_timeouts
+        self._users = 0
+
+    def _build_client(self) -> httpx.AsyncClient:
+        pool_size = self._client_kwargs['limits'].max_connections
+        self._client_kwargs['limits'] = httpx.Limits(
+            max_connections=pool_size,
+            max_keepalive_connections=pool_size,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+        self._client_kwargs['event_hooks'] = {'request': [self._attach_trace]}
+        self._client_kwargs['verify'] = _ssl_context()
+        return super()._build_client()
+
+    async def _attach_trace(self, request) -> None:
+        request.extensions['trace'] = self._trace
+
+    async def _trace(self, event: str, info: dict) -> None:
+        if event == 'connection.connect_tcp.complete':
+            metrics.inc('http_connections_opened_total', (('pool', self.pool),))
+
+    async def initialize(self) -> None:
+        self._users += 1
+        await super().initialize()
+
+    async def shutdown(self) -> None:
+        self._users = max(self._users - 1, 0)
+        if self._users == 0:
+            await super().shutdown()
+
+    async def do_request(self, url, method, request_data=None, *args, **kwargs):
+        base_url, endpoint = url.rsplit('/', 1)
+        labels = (('bot', metrics.bot_name_for_url(base_url)), ('method', endpoint))
+        reply = inline_reply.get()
+        if reply is not None and reply.method is None:
+            if endpoint in INLINE_METHODS and not (request_data and request_data.contains_files):
+                reply.method = endpoint
+                reply.parameters = request_data.parameters if request_data else {}
+                metrics.inc('inline_replies_total', labels)
+                return 200, _INLINE_RESULT
+
+        timeout = self.method_timeouts.get(endpoint)
+        if timeout is not None and kwargs.get('read_timeout', BaseRequest.DEFAULT_NONE) is BaseRequest.DEFAULT_NONE:
+            kwargs['read_timeout'] = timeout
+
+        limited = self.scheduler is not None and endpoint in LIMITED_METHODS
+        chat_id = request_data.parameters.get('chat_id') if limited and request_data else None
+        for attempt in range(MAX_RETRIES + 1):
+            if limited:
+                await self.scheduler.acquire(base_url, chat_id)
+            status, payload = await self._send(labels, url, method, request_data, *args, **kwargs)
+            if status != 429 or self.scheduler is None or attempt == MAX_RETRIES:
+                return status, payload
+            retry_after = _retry_after(payload)
+            if retry_after is None or retry_after > MAX_RETRY_AFTER:
+                return status, payload
+            metrics.inc('api_retries_total', labels)
+            if limited:
+                self.scheduler.retry_after(base_url, retry_after)
+            else:
+                await asyncio.sleep(retry_after)
+
+    async def _send(self, labels, url, method, request_data, *args, **kwargs):
+        metrics.inc('api_requests_total', labels)
+        started = time.perf_counter()
+        try:
+            status, payload = await super().do_request(url, method, request_data, *args, **kwargs)
+        except Exception:
+            metrics.inc('api_errors_total', labels)
+            health.api_error(labels[0][1])
+            raise
+        metrics.observe('api_request_seconds', labels, time.perf_counter() - started)
+        if status < 500:
+            health.api_ok(labels[0][1])
+        else:
+            health.api_error(labels[0][1])
+        if status == 429:
+            metrics.inc('api_rate_limited_total', labels)
+        return status, payload
@@ -0,0 +1,111 @@
+"""
+Event loop monitor: lag percentiles and a watchdog that catches blocking code.
+"""
+
+import os
+import sys
+import time
+import asyncio
+import logging
+import threading
+import traceback
+from collections import deque
+
+from core.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+QUANTILES = (0.5, 0.9, 0.99)
+# Innermost frames of the loop thread logged for a stall
+STACK_LIMIT = 25
+
+
+class LoopMonitor:
+    """Sample event loop lag and log a stack snapshot whenever the loop is blocked.
+
+    A task sleeps ``interval`` seconds (env ``LOOP_LAG_INTERVAL``, default 0.25) in
+    a loop; how much later than that it wakes up is the lag, kept for the last
+    ``window`` samples and exported as ``event_loop_lag_seconds{quantile}``.
+
+    Each wake-up is also a heartbeat for a watchdog thread. When the heartbeat is
+    more than ``threshold`` seconds late (env ``LOOP_BLOCK_THRESHOLD``, default 0.25)
+    the loop is stuck in a callback; the watchdog logs the loop thread's current
+    stack once per stall, while the blocking code is still on it.
+    """
+
+    def __init__(self, interval=None, threshold=None, window=240):
+        self.interval = interval or float(os.getenv('LOOP_LAG_INTERVAL', 0.25))
+        self.threshold = threshold or float(os.getenv('LOOP_BLOCK_THRESHOLD', 0.25))
+        self.samples = deque(maxlen=window)
+        self._beat = 0.0
+        self._loop = None
+        self._loop_thread = None
+        self._task = None
+        self._watchdog = None
+        self._stopped = threading.Event()
+        for q in QUANTILES:
+            metrics.gauge('event_loop_lag_seconds', (('quantile', str(q)),), lambda q=q: self.percentile(q))
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None
+
+    def percentile(self, q: float) -> float:
+        if not self.samples:
+            return 0.0
+        ordered = sorted(self.samples)
+        return round(ordered[min(len(ordered) - 1, int(len(ordered) * q))], 6)
+
+    def start(self) -> None:
+        """Start sampling on the running loop and start the watchdog thread."""
+        if self.running:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread = threading.get_ident()
+        self._beat = time.monotonic()
+        self._stopped.clear()
+        self._task = asyncio.create_task(self._sample())
+        self._watchdog = threading.Thread(target=self._watch, name='loop-watchdog', daemon=True)
+        self._watchdog.start()
+
+    async def stop(self) -> None:
+        if not self.running:
+            return
+        self._stopped.set()
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        # Wakes up at once: it waits on the event
+        self._watchdog.join()
+
+    async def _sample(self) -> None:
+        while True:
+            expected = time.monotonic() + self.interval
+            await asyncio.sleep(self.interval)
+            now = time.monotonic()
+            lag = max(now - expected, 0.0)
+            self.samples.append(lag)
+            self._beat = now
+            if lag > self.threshold:
+                logger.warning(f"⚠️ Event loop was blocked for {lag * 1000:.0f} ms")
+
+    def _watch(self) -> None:
+        reported = None
+        while not self._stopped.wait(self.threshold / 2):
+            beat = self._beat
+            blocked = time.monotonic() - beat - self.interval
+            if blocked <= self.threshold or beat == reported:
+                continue
+            reported = beat
+            frame = sys._current_frames().get(self._loop_thread)
+            stack = ''.join(traceback.format_stack(frame, limit=STACK_LIMIT)) if frame else ''
+            logger.warning(f"⚠️ Event loop blocked for {blocked * 1000:.0f} ms so far, loop thread is at:\n{stack}")
+            # Metrics belong to the loop thread; counted once it is free again
+            self._loop.call_soon_threadsafe(metrics.inc, 'event_loop_stalls_total', ())
+
+
+# One loop per process
+loop_monitor = LoopMonitor()
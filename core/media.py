@@ -0,0 +1,183 @@
+"""
+Media registry: upload each asset once per bot and re-send it by Telegram file_id.
+"""
+
+import os
+import json
+import asyncio
+import hashlib
+import logging
+import threading
+
+from telegram import InputFile
+from telegram.error import BadRequest
+
+logger = logging.getLogger(__name__)
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_CACHE_PATH = os.path.join(ROOT_DIR, 'logs', 'media_cache.json')
+# Written by build_assets.py
+BUILD_DIR = os.path.join(ROOT_DIR, 'assets', 'build')
+# BadRequest descriptions that mean a cached file_id can no longer be sent
+STALE_FILE_ID_ERRORS = ('wrong file identifier', 'wrong remote file', 'file reference expired')
+
+
+class Asset:
+    """An image held in memory: the bytes sent to Telegram and their SHA-256."""
+
+    __slots__ = ('name', 'filename', 'data', 'digest')
+
+    def __init__(self, name: str, filename: str, data: bytes):
+        self.name = name
+        self.filename = filename
+        self.data = data
+        self.digest = hashlib.sha256(data).hexdigest()
+
+
+def load_asset(path: str, build_dir=BUILD_DIR) -> Asset:
+    """Read an asset, preferring its optimized build while that was made from this source.
+
+    Blocking; call it at startup, not from a handler. Raises FileNotFoundError
+    if the source is missing.
+    """
+    name = os.path.basename(path)
+    with open(path, 'rb') as f:
+        source = f.read()
+    try:
+        with open(os.path.join(build_dir, 'manifest.json'), 'r', encoding='utf-8') as f:
+            entry = json.load(f).get(name)
+    except (OSError, ValueError):
+        entry = None
+    if entry and entry['source_sha256'] == hashlib.sha256(source).hexdigest():
+        variant = entry['variants'][entry['photo']]
+        try:
+            with open(os.path.join(build_dir, variant['file']), 'rb') as f:
+                data = f.read()
+            filename = f"{os.path.splitext(name)[0]}.{entry['photo']}"
+            logger.info(f"🖼️ Using optimized {variant['file']} for {name} ({len(source):,} -> {len(data):,} bytes)")
+            return Asset(name, filename, data)
+        except OSError as e:
+            logger.warning(f"⚠️ Could not read optimized {name}: {e}")
+    else:
+        logger.info(f"🖼️ No current build of {name}, sending the original (run build_assets.py)")
+    return Asset(name, name, source)
+
+
+def is_stale_file_id(error: BadRequest) -> bool:
+    """Whether Telegram rejected a send because of the file_id itself."""
+    message = str(error).lower()
+    return any(reason in message for reason in STALE_FILE_ID_ERRORS)
+
+
+class MediaRegistry:
+    """Remember the file_id Telegram returns for every uploaded asset.
+
+    Entries are stored per bot (file_ids are only valid for the bot that uploaded
+    them) and per asset, together with the SHA-256 of the file content. When the
+    file on disk changes its hash no longer matches and the asset is uploaded again.
+    """
+
+    def __init__(self, cache_path=None):
+        self.cache_path = cache_path or os.getenv('MEDIA_CACHE_PATH', DEFAULT_CACHE_PATH)
+        self._entries = None
+        self._assets = {}
+        self._write_lock = threading.Lock()
+        self._uploads = {}
+        self._version = 0
+        self._written = 0
+
+    def preload(self, path: str) -> Asset:
+        """Load ``path`` and the file_id cache into memory once; handlers then never touch the disk."""
+        self._load()
+        asset = self._assets.get(path)
+        if asset is None:
+            asset = self._assets[path] = load_asset(path)
+        return asset
+
+    def _load(self) -> dict:
+        if self._entries is None:
+            try:
+                with open(self.cache_path, 'r', encoding='utf-8') as f:
+                    self._entries = json.load(f)
+            except FileNotFoundError:
+                self._entries = {}
+            except (OSError, ValueError) as e:
+                logger.warning(f"⚠️ Could not read media cache {self.cache_path}: {e}")
+                self._entries = {}
+        return self._entries
+
+    def _write(self, version: int, data: str) -> None:
+        tmp_path = self.cache_path + '.tmp'
+        try:
+            with self._write_lock:
+                if version < self._written:
+                    # A newer snapshot is already on disk
+                    return
+                self._written = version
+                os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    f.write(data)
+                os.replace(tmp_path, self.cache_path)
+        except OSError as e:
+            # Read-only filesystem: keep the file_ids in memory for this run
+            logger.warning(f"⚠️ Could not write media cache {self.cache_path}: {e}")
+
+    async def _save(self) -> None:
+        # Serialized on the loop, written in a thread
+        self._version += 1
+        await asyncio.to_thread(self._write, self._version, json.dumps(self._entries, indent=2, sort_keys=True))
+
+    def get(self, bot_id: str, name: str, digest: str):
+        """Return the cached file_id for an asset, or None if missing or stale."""
+        entry = self._load().get(bot_id, {}).get(name)
+        if entry and entry.get('sha256') == digest:
+            return entry.get('file_id')
+        return None
+
+    async def remember(self, bot_id: str, name: str, digest: str, file_id: str) -> None:
+        self._load().setdefault(bot_id, {})[name] = {'sha256': digest, 'file_id': file_id}
+        await self._save()
+
+    async def forget(self, bot_id: str, name: str) -> None:
+        if self._load().get(bot_id, {}).pop(name, None) is not None:
+            await self._save()
+
+    async def send_photo(self, bot, chat_id: int, asset: Asset, **kwargs):
+        """Send a preloaded photo, uploading it only if no valid file_id is known."""
+        # The numeric part of the token is the bot id; it never exposes the secret
+        bot_id = bot.token.split(':', 1)[0]
+        name, digest = asset.name, asset.digest
+
+        file_id = self.get(bot_id, name, digest)
+        if not file_id:
+            # Concurrent first sends (a burst of /start) wait for one upload instead of each uploading
+            lock = self._uploads.get((bot_id, name))
+            if lock is None:
+                lock = self._uploads[bot_id, name] = asyncio.Lock()
+            async with lock:
+                file_id = self.get(bot_id, name, digest)
+                if not file_id:
+                    return await self._upload(bot, bot_id, chat_id, asset, **kwargs)
+        try:
+            return await bot.send_photo(chat_id=chat_id, photo=file_id, **kwargs)
+        except BadRequest as e:
+            # Anything else (chat not found, caption parse error) would fail the upload too
+            if not is_stale_file_id(e):
+                raise
+            logger.warning(f"⚠️ Cached file_id for {name} rejected ({e}), uploading again")
+            await self.forget(bot_id, name)
+        return await self._upload(bot, bot_id, chat_id, asset, **kwargs)
+
+    async def _upload(self, bot, bot_id: str, chat_id: int, asset: Asset, **kwargs):
+        name, digest = asset.name, asset.digest
+        photo = InputFile(asset.data, filename=asset.filename)
+        sent = await bot.send_photo(chat_id=chat_id, photo=photo, **kwargs)
+        if sent.photo:
+            # The largest size comes last; any size's file_id re-sends the full photo set
+            await self.remember(bot_id, name, digest, sent.photo[-1].file_id)
+            logger.info(f"📤 Uploaded {name} for bot {bot_id}, cached its file_id")
+        return sent
+
+
+# One registry per process so bots sharing a process share the cache file
+media_registry = MediaRegistry()
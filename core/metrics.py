@@ -0,0 +1,161 @@
+"""
+In-process metrics, exported in the Prometheus text format on ``/metrics``.
+"""
+
+from bisect import bisect_left
+from collections import defaultdict
+
+from telegram import Update
+
+# Upper bounds (seconds) of the latency histogram buckets
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Callback data comes from users; cap the distinct label values per bot
+MAX_CALLBACK_LABELS = 100
+
+PREFIX = 'trustcoin_'
+
+# name -> (type, help)
+DESCRIPTIONS = {
+    'updates_total': ('counter', 'Updates received, by update type and callback_data.'),
+    'handler_seconds': ('histogram', 'Handler run time, by handler and section.'),
+    'api_requests_total': ('counter', 'Bot API requests sent, by method.'),
+    'api_request_seconds': ('histogram', 'Bot API request latency, by method.'),
+    'api_rate_limited_total': ('counter', 'Bot API requests answered with 429 Too Many Requests.'),
+    'api_errors_total': ('counter', 'Bot API requests that failed without an HTTP response.'),
+    'api_retries_total': ('counter', 'Bot API requests retried after a 429 RetryAfter.'),
+    'http_connections_opened_total': ('counter', 'New connections opened to the Bot API, per pool.'),
+    'outbound_queue_seconds': ('histogram', 'Time outbound messages waited for the rate limiter, by priority.'),
+    'outbound_queue_depth': ('gauge', 'Outbound messages waiting for the rate limiter.'),
+    'inline_replies_total': ('counter', 'Bot API calls returned in the webhook response instead of sent.'),
+    'edit_cache_hits_total': ('counter', 'Edits skipped because the message already shows the content.'),
+    'edit_cache_misses_total': ('counter', 'Edits sent after checking the sent-content cache.'),
+    'duplicate_updates_total': ('counter', 'Webhook re-deliveries dropped by update_id.'),
+    'updates_in_flight': ('gauge', 'Updates whose handlers are running.'),
+    'updates_waiting': ('gauge', 'Updates waiting for an earlier update of their chat or a free slot.'),
+    'event_loop_lag_seconds': ('gauge', 'Event loop lag over the recent samples, by quantile.'),
+    'event_loop_stalls_total': ('counter', 'Times a callback blocked the event loop past LOOP_BLOCK_THRESHOLD.'),
+    'startup_seconds': ('gauge', 'Duration of each startup phase, or offset of a milestone, in seconds.'),
+    'update_queue_depth': ('gauge', 'Updates waiting in the Application update queue.'),
+    'catch_up_updates_total': ('counter', 'Pending updates found on start, queued or coalesced away.'),
+    'taps_throttled_total': ('counter', 'Taps over the per-user rate limit, answered with a toast only.'),
+    'throttle_evictions_total': ('counter', 'Active users dropped from a full tap throttle table.'),
+}
+
+
+class Histogram:
+    __slots__ = ('counts', 'sum')
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS) + 1)
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(BUCKETS, value)] += 1
+        self.sum += value
+
+
+class Metrics:
+    """Counters, histograms and gauges keyed by (name, labels).
+
+    Labels are tuples of ``(key, value)`` pairs. Everything is recorded from the
+    event loop thread, so plain dict updates are enough: no locks on the hot path.
+    Gauges are callables evaluated only when ``/metrics`` is scraped.
+    """
+
+    def __init__(self):
+        self.counters = defaultdict(int)
+        self.histograms = defaultdict(Histogram)
+        self.gauges = {}
+        self._bot_names = {}
+        self._callback_labels = defaultdict(set)
+
+    def inc(self, name: str, labels: tuple, amount=1) -> None:
+        self.counters[name, labels] += amount
+
+    def observe(self, name: str, labels: tuple, value: float) -> None:
+        self.histograms[name, labels].observe(value)
+
+    def gauge(self, name: str, labels: tuple, read) -> None:
+        self.gauges[name, labels] = read
+
+    def register_bot(self, name: str, application) -> None:
+        """Label the metrics of ``application`` with ``name`` and export its queue gauges."""
+        bot = application.bot
+        self._bot_names[bot.token] = name
+        self._bot_names[bot.base_url] = name
+        labels = (('bot', name),)
+        self.gauge('update_queue_depth', labels, application.update_queue.qsize)
+        processor = application.update_processor
+        if hasattr(processor, 'in_flight'):
+            self.gauge('updates_in_flight', labels, lambda: processor.in_flight)
+            self.gauge('updates_waiting', labels, lambda: processor.waiting)
+
+    def bot_name(self, bot) -> str:
+        return self._bot_names.get(bot.token, 'unknown')
+
+    def bot_name_for_url(self, base_url: str) -> str:
+        return self._bot_names.get(base_url, 'unknown')
+
+    def callback_label(self, bot: str, data) -> str:
+        seen = self._callback_labels[bot]
+        if data in seen:
+            return data
+        if data is None or len(seen) >= MAX_CALLBACK_LABELS:
+            return 'other'
+        seen.add(data)
+        return data
+
+    async def count_update(self, update, context) -> None:
+        """TypeHandler callback counting every update before the regular handlers run.
+
+        Accepts ``Update`` objects and the webhook fast-path views.
+        """
+        bot = self.bot_name(context.bot)
+        query = getattr(update, 'callback_query', None)
+        if query is not None:
+            data = self.callback_label(bot, query.data)
+            self.inc('updates_total', (('bot', bot), ('type', 'callback_query'), ('callback_data', data)))
+            return
+        if getattr(update, 'message', None) is not None:
+            kind = 'message'
+        else:
+            kind = next((str(t) for t in Update.ALL_TYPES if getattr(update, t, None) is not None), 'other')
+        self.inc('updates_total', (('bot', bot), ('type', kind), ('callback_data', '')))
+
+    def render(self) -> str:
+        """Return every metric in the Prometheus text exposition format."""
+        series = defaultdict(list)
+        for (name, labels), value in self.counters.items():
+            series[name].append(f"{PREFIX}{name}{_labels(labels)} {value}")
+        for (name, labels), read in self.gauges.items():
+            series[name].append(f"{PREFIX}{name}{_labels(labels)} {read()}")
+        for (name, labels), histogram in self.histograms.items():
+            cumulative = 0
+            for bound, count in zip(BUCKETS + ('+Inf',), histogram.counts):
+                cumulative += count
+                series[name].append(f"{PREFIX}{name}_bucket{_labels(labels + (('le', bound),))} {cumulative}")
+            series[name].append(f"{PREFIX}{name}_sum{_labels(labels)} {histogram.sum:.6f}")
+            series[name].append(f"{PREFIX}{name}_count{_labels(labels)} {cumulative}")
+
+        lines = []
+        for name in sorted(series):
+            kind, description = DESCRIPTIONS.get(name, ('untyped', name))
+            lines.append(f"# HELP {PREFIX}{name} {description}")
+            lines.append(f"# TYPE {PREFIX}{name} {kind}")
+            lines.extend(series[name])
+        return '\n'.join(lines) + '\n'
+
+
+def _escape(value) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _labels(labels: tuple) -> str:
+    if not labels:
+        return ''
+    return '{' + ','.join(f'{key}="{_escape(value)}"' for key, value in labels) + '}'
+
+
+# Shared by every bot in the process
+metrics = Metrics()
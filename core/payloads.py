@@ -0,0 +1,107 @@
+"""
+Pre-encoded Bot API payloads: the static part of every section reply, encoded once.
+"""
+
+import os
+from collections import OrderedDict
+from types import MappingProxyType
+
+from telegram.request import RequestData
+
+# Telegram's limit for photo captions, counted in UTF-16 code units after entity parsing
+CAPTION_LIMIT = 1024
+
+
+def fits_caption(text: str) -> bool:
+    """Whether ``text`` surely fits in a photo caption (markup characters are counted too)."""
+    return len(text.encode('utf-16-le')) // 2 <= CAPTION_LIMIT
+
+
+class SectionPayload:
+    """Text, parse mode and reply markup of one section, ready to send.
+
+    ``field`` is ``'text'`` for messages and ``'caption'`` for photo captions.
+
+    ``parameters`` holds plain values (used for inline webhook replies) and
+    ``json_parameters`` the form-encoded strings sent to the Bot API, with the
+    keyboard JSON taken from the catalog instead of re-serialized per request.
+    ``digest`` identifies the rendered content.
+    """
+
+    __slots__ = ('parameters', 'json_parameters', 'digest')
+
+    def __init__(self, section, field='text'):
+        self.parameters = {field: section.text, 'reply_markup': section.keyboard.markup.to_dict()}
+        self.json_parameters = {field: section.text, 'reply_markup': section.keyboard.json}
+        if section.parse_mode:
+            self.parameters['parse_mode'] = section.parse_mode
+            self.json_parameters['parse_mode'] = section.parse_mode
+        self.digest = hash(tuple(sorted(self.json_parameters.items())))
+
+
+class PreparedRequestData(RequestData):
+    """RequestData for a SectionPayload plus the per-update ids (chat_id, message_id)."""
+
+    __slots__ = ('_payload', '_ids')
+
+    def __init__(self, payload: SectionPayload, ids: dict):
+        super().__init__()
+        self._payload = payload
+        self._ids = ids
+
+    @property
+    def parameters(self) -> dict:
+        return {**self._ids, **self._payload.parameters}
+
+    @property
+    def json_parameters(self) -> dict:
+        return {**{key: str(value) for key, value in self._ids.items()}, **self._payload.json_parameters}
+
+
+class SentContent:
+    """Bounded LRU of the payload digest last shown in each (chat_id, message_id).
+
+    Lets an edit to the content a message already shows be skipped locally
+    instead of being rejected by Telegram with "message is not modified".
+    """
+
+    def __init__(self, max_size=None):
+        self.max_size = max_size or int(os.getenv('EDIT_CACHE_SIZE', 10000))
+        self._entries = OrderedDict()
+
+    def matches(self, chat_id: int, message_id: int, digest: int) -> bool:
+        key = (chat_id, message_id)
+        current = self._entries.get(key)
+        if current is None:
+            return False
+        self._entries.move_to_end(key)
+        return current == digest
+
+    def remember(self, chat_id: int, message_id: int, digest: int) -> None:
+        key = (chat_id, message_id)
+        self._entries[key] = digest
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+
+def build_payloads(catalog) -> MappingProxyType:
+    """Encode every section of a catalog once: callback_data -> SectionPayload."""
+    return MappingProxyType({data: SectionPayload(section) for data, section in catalog.sections.items()})
+
+
+def build_caption_payloads(catalog) -> MappingProxyType:
+    """Caption payloads for the sections short enough to replace a photo's caption."""
+    return MappingProxyType({
+        data: SectionPayload(section, 'caption')
+        for data, section in catalog.sections.items()
+        if fits_caption(section.text)
+    })
+
+
+async def send_prepared(bot, method: str, payload: SectionPayload, **ids):
+    """Call a Bot API method with a pre-encoded payload, skipping PTB's generic encoding.
+
+    Returns the raw API result; it is not parsed into Telegram objects.
+    """
+    return await bot.request.post(f"{bot.base_url}/{method}", request_data=PreparedRequestData(payload, ids))
@@ -0,0 +1,131 @@
+"""
+Concurrent update processing that keeps each chat's updates in order.
+"""
+
+import os
+import asyncio
+
+from telegram.ext import BaseUpdateProcessor
+
+# Never reached; see ChatOrderedUpdateProcessor
+_UNBOUNDED = 2 ** 30
+
+
+def chat_key(update):
+    """The chat an update belongs to (the user for chat-less updates), or None."""
+    chat = getattr(update, 'effective_chat', None)
+    if chat is not None:
+        return chat.id
+    # Fast-path views carry the chat on their message
+    message = getattr(update, 'message', None)
+    if message is not None:
+        return message.chat_id
+    user = getattr(update, 'effective_user', None)
+    return user.id if user is not None else None
+
+
+class ChatOrderedUpdateProcessor(BaseUpdateProcessor):
+    """Process updates from different chats concurrently and each chat's updates in order.
+
+    At most ``max_concurrent_updates`` (env ``CONCURRENT_UPDATES``, default 64) handlers
+    run at once. PTB acquires the base class semaphore before calling
+    :meth:`do_process_update`; it is made unbounded so updates reach
+    :meth:`do_process_update` in arrival order, take their place behind the previous
+    update of their chat, and only then wait for a free slot.
+
+    ``in_flight`` and ``waiting`` count running and queued updates, ``completed`` the
+    updates handled so far. On shutdown :meth:`join` waits for the ones in progress
+    and :meth:`abandon` gives up on whatever is left.
+    """
+
+    def __init__(self, max_concurrent_updates=None):
+        self._limit = max_concurrent_updates or int(os.getenv('CONCURRENT_UPDATES', 64))
+        super().__init__(_UNBOUNDED)
+        # The base class sized its semaphore from max_concurrent_updates, i.e. the real limit
+        self._semaphore = asyncio.BoundedSemaphore(_UNBOUNDED)
+        self._slots = asyncio.BoundedSemaphore(self._limit)
+        self._tails = {}
+        self.in_flight = 0
+        self.waiting = 0
+        self.completed = 0
+        # Tasks between do_process_update entry and exit
+        self._tasks = set()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._abandoned = False
+
+    @property
+    def max_concurrent_updates(self) -> int:
+        return self._limit
+
+    async def initialize(self) -> None:
+        pass
+
+    async def shutdown(self) -> None:
+        pass
+
+    def _release(self, key, done) -> None:
+        done.set_result(None)
+        if self._tails.get(key) is done:
+            del self._tails[key]
+
+    async def join(self) -> None:
+        """Wait until no update is running or waiting."""
+        await self._idle.wait()
+
+    def abandon(self) -> int:
+        """Cancel every running and waiting update, and drop any that arrive later.
+
+        Returns how many were cancelled. Their ``do_process_update`` returns normally,
+        so PTB still marks them done and ``Application.stop()`` does not hang on them.
+        """
+        self._abandoned = True
+        for task in self._tasks:
+            task.cancel()
+        return len(self._tasks)
+
+    async def do_process_update(self, update, coroutine) -> None:
+        if self._abandoned:
+            coroutine.close()
+            return
+        task = asyncio.current_task()
+        self._tasks.add(task)
+        self._idle.clear()
+        try:
+            await self._process(update, coroutine)
+        except asyncio.CancelledError:
+            if not self._abandoned:
+                raise
+        finally:
+            self._tasks.discard(task)
+            if not self._tasks:
+                self._idle.set()
+
+    async def _process(self, update, coroutine) -> None:
+        key = chat_key(update)
+        previous = self._tails.get(key) if key is not None else None
+        done = asyncio.get_running_loop().create_future()
+        if key is not None:
+            self._tails[key] = done
+
+        self.waiting += 1
+        try:
+            if previous is not None:
+                # asyncio.wait does not cancel ``previous`` if this task is cancelled
+                await asyncio.wait((previous,))
+            await self._slots.acquire()
+        except BaseException:
+            self.waiting -= 1
+            coroutine.close()
+            self._release(key, done)
+            raise
+        self.waiting -= 1
+
+        self.in_flight += 1
+        try:
+            await coroutine
+            self.completed += 1
+        finally:
+            self.in_flight -= 1
+            self._slots.release()
+            self._release(key, done)
@@ -0,0 +1,195 @@
+"""
+Outbound scheduler: keep every bot within Telegram's flood limits.
+
+Telegram allows about 30 messages per second per bot and about one message per
+second per chat (short bursts are tolerated). Message-producing calls wait here
+for both budgets. Interactive traffic (replies to a user's tap or command, the
+default) is always released before bulk traffic; bulk senders mark their calls
+with ``outbound_priority.set(BULK)``.
+"""
+
+import os
+import time
+import asyncio
+import logging
+import contextvars
+from collections import deque
+
+from core.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+INTERACTIVE = 0
+BULK = 1
+PRIORITY_NAMES = ('interactive', 'bulk')
+
+# Priority of the Bot API calls made by the current task
+outbound_priority = contextvars.ContextVar('outbound_priority', default=INTERACTIVE)
+
+# Calls that put or change a message in a chat; everything else is not throttled
+LIMITED_METHODS = frozenset({
+    'sendMessage',
+    'sendPhoto',
+    'sendDocument',
+    'sendVideo',
+    'sendAnimation',
+    'sendMediaGroup',
+    'copyMessage',
+    'forwardMessage',
+    'editMessageText',
+    'editMessageCaption',
+    'editMessageMedia',
+    'editMessageReplyMarkup',
+})
+
+# Per-chat buckets idle for this long are full again and can be dropped
+CHAT_IDLE_SECONDS = 60
+
+
+class TokenBucket:
+    __slots__ = ('rate', 'capacity', 'tokens', 'updated')
+
+    def __init__(self, rate: float, capacity: float, now: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = now
+
+    def wait_time(self, now: float) -> float:
+        """Seconds until one token is available (0 if one is available now)."""
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        return 0.0 if self.tokens >= 1 else (1 - self.tokens) / self.rate
+
+    def take(self) -> None:
+        self.tokens -= 1
+
+
+class _Waiter:
+    __slots__ = ('chat_id', 'future', 'queued')
+
+    def __init__(self, chat_id, future, queued):
+        self.chat_id = chat_id
+        self.future = future
+        self.queued = queued
+
+
+class _BotLane:
+    """Buckets and waiting calls of one bot token."""
+
+    def __init__(self, scheduler, name: str, now: float):
+        self.scheduler = scheduler
+        self.name = name
+        self.bucket = TokenBucket(scheduler.rate, scheduler.burst, now)
+        self.chats = {}
+        self.queues = (deque(), deque())
+        self.paused_until = 0.0
+        self.dispatcher = None
+        self._wakeup = asyncio.Event()
+        metrics.gauge('outbound_queue_depth', (('bot', name),), self.depth)
+
+    def depth(self) -> int:
+        return len(self.queues[INTERACTIVE]) + len(self.queues[BULK])
+
+    def _chat_bucket(self, chat_id, now: float) -> TokenBucket:
+        bucket = self.chats.get(chat_id)
+        if bucket is None:
+            if len(self.chats) >= self.scheduler.max_chats:
+                self._evict_idle(now)
+            bucket = self.chats[chat_id] = TokenBucket(self.scheduler.chat_rate, self.scheduler.chat_burst, now)
+        return bucket
+
+    def _evict_idle(self, now: float) -> None:
+        for chat_id in [c for c, b in self.chats.items() if now - b.updated > CHAT_IDLE_SECONDS]:
+            del self.chats[chat_id]
+
+    def _wait_time(self, chat_id, now: float) -> float:
+        """Seconds until a call to ``chat_id`` may go out; takes the tokens when it is 0."""
+        wait = max(self.paused_until - now, self.bucket.wait_time(now))
+        if chat_id is not None:
+            chat_bucket = self._chat_bucket(chat_id, now)
+            wait = max(wait, chat_bucket.wait_time(now))
+        if wait <= 0:
+            self.bucket.take()
+            if chat_id is not None:
+                chat_bucket.take()
+        return wait
+
+    async def acquire(self, chat_id, priority: int) -> None:
+        now = time.monotonic()
+        labels = (('bot', self.name), ('priority', PRIORITY_NAMES[priority]))
+        # Fast path: nothing queued ahead of us and both budgets available
+        if not self.depth() and self._wait_time(chat_id, now) <= 0:
+            metrics.observe('outbound_queue_seconds', labels, 0.0)
+            return
+
+        waiter = _Waiter(chat_id, asyncio.get_running_loop().create_future(), now)
+        self.queues[priority].append(waiter)
+        if self.dispatcher is None or self.dispatcher.done():
+            self.dispatcher = asyncio.create_task(self._dispatch())
+        else:
+            self._wakeup.set()
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            if not waiter.future.done():
+                self.queues[priority].remove(waiter)
+            raise
+        metrics.observe('outbound_queue_seconds', labels, time.monotonic() - waiter.queued)
+
+    async def _dispatch(self) -> None:
+        """Release waiting calls, interactive first, as their budgets allow."""
+        while self.depth():
+            now = time.monotonic()
+            next_wake = None
+            for queue in self.queues:
+                for waiter in list(queue):
+                    wait = self._wait_time(waiter.chat_id, now)
+                    if wait <= 0:
+                        queue.remove(waiter)
+                        if not waiter.future.done():
+                            waiter.future.set_result(None)
+                    else:
+                        next_wake = wait if next_wake is None else min(next_wake, wait)
+            if next_wake is not None:
+                # Sleep until a budget refills, or until a new call is queued
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), next_wake)
+                except asyncio.TimeoutError:
+                    pass
+
+    def pause(self, seconds: float) -> None:
+        """Hold every call of this bot for ``seconds`` (after a 429 RetryAfter)."""
+        self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+
+
+class OutboundScheduler:
+    """Rate limits per bot token and per chat, shared by every bot of a request object.
+
+    Limits come from ``OUTBOUND_RATE`` (messages/s per bot, default 30),
+    ``OUTBOUND_CHAT_RATE`` (messages/s per chat, default 1) and
+    ``OUTBOUND_CHAT_BURST`` (messages a chat may burst, default 3).
+    """
+
+    def __init__(self, rate=None, chat_rate=None, chat_burst=None, max_chats=10000):
+        self.rate = rate or float(os.getenv('OUTBOUND_RATE', 30))
+        self.burst = self.rate
+        self.chat_rate = chat_rate or float(os.getenv('OUTBOUND_CHAT_RATE', 1))
+        self.chat_burst = chat_burst or float(os.getenv('OUTBOUND_CHAT_BURST', 3))
+        self.max_chats = max_chats
+        self._lanes = {}
+
+    def lane(self, base_url: str) -> _BotLane:
+        lane = self._lanes.get(base_url)
+        if lane is None:
+            lane = self._lanes[base_url] = _BotLane(self, metrics.bot_name_for_url(base_url), time.monotonic())
+        return lane
+
+    async def acquire(self, base_url: str, chat_id) -> None:
+        """Wait until a message-producing call of this bot to ``chat_id`` may be sent."""
+        await self.lane(base_url).acquire(chat_id, outbound_priority.get())
+
+    def retry_after(self, base_url: str, seconds: float) -> None:
+        logger.warning(f"⚠️ Flood control for bot '{self.lane(base_url).name}': pausing sends for {seconds}s")
+        self.lane(base_url).pause(seconds)
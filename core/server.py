@@ -0,0 +1,166 @@
+"""
+Async webhook server (aiohttp) running on the same event loop as the bots.
+"""
+
+import os
+import time
+import logging
+
+from aiohttp import web
+from telegram import Update
+
+from core import fastpath
+from core.dedup import UpdateWindow, peek_update_id
+from core.health import health, loop_lag
+from core.loopmon import loop_monitor
+from core.http import InlineReply, inline_reply
+from core.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+
+class WebhookServer:
+    """Serve ``/webhook/<bot>``, ``/webhook``, ``/health``, ``/ready``, ``/metrics`` and ``/`` for a set of bots.
+
+    ``applications`` is the host's name -> Application mapping; bots added to the
+    host later are routed without re-registering anything. ``/webhook`` without a
+    bot name is accepted when exactly one bot is running, as in the single-bot scripts.
+
+    With ``inline_replies`` (env ``WEBHOOK_INLINE_REPLIES=1``) each update is processed
+    before responding, and the first send/edit/answer it makes is returned in the
+    response body instead of being sent as a separate Bot API request.
+
+    Taps and ``/start`` are decoded by :mod:`core.fastpath` for bots that installed
+    it, unless ``fast_path`` (env ``WEBHOOK_FAST_PATH``) is turned off.
+
+    Re-deliveries of the last ``dedup_window`` (env ``WEBHOOK_DEDUP_WINDOW``) update_ids
+    of each bot are acknowledged and dropped before they are decoded.
+
+    ``/health`` answers as long as the event loop does (liveness); ``/ready`` returns
+    503 unless ``readiness()`` (the host's, by default every bot running) says the
+    bots can take updates.
+
+    Once ``accepting`` is cleared (on shutdown) new deliveries get a 503, so Telegram
+    retries them against the next instance, while updates already taken are finished.
+    """
+
+    def __init__(self, applications: dict, home_text='TrustCoin Bot is running!', inline_replies=None,
+                 fast_path=None, dedup_window=None, readiness=None):
+        self.applications = applications
+        self.home_text = home_text
+        self.readiness = readiness or self._all_running
+        if inline_replies is None:
+            inline_replies = os.getenv('WEBHOOK_INLINE_REPLIES', '').lower() in ('1', 'true', 'yes')
+        self.inline_replies = inline_replies
+        if fast_path is None:
+            fast_path = os.getenv('WEBHOOK_FAST_PATH', '1').lower() not in ('0', 'false', 'no')
+        self.fast_path = fast_path
+        self._accepts_views = {}
+        self.dedup_window = dedup_window or int(os.getenv('WEBHOOK_DEDUP_WINDOW', 4096))
+        self._windows = {}
+        self.accepting = True
+        self.app = web.Application()
+        self.app.router.add_post('/webhook', self.webhook)
+        self.app.router.add_post('/webhook/{bot}', self.webhook)
+        self.app.router.add_get('/health', self.health)
+        self.app.router.add_get('/ready', self.ready)
+        self.app.router.add_get('/metrics', self.export_metrics)
+        self.app.router.add_get('/', self.home)
+        self._runner = None
+
+    def _lookup(self, request):
+        name = request.match_info.get('bot')
+        if name is None and len(self.applications) == 1:
+            name = next(iter(self.applications))
+        return name, self.applications.get(name)
+
+    async def webhook(self, request):
+        """Handle incoming webhook updates."""
+        if not self.accepting:
+            return web.Response(status=503, text='Shutting down')
+        name, application = self._lookup(request)
+        if application is None:
+            return web.Response(status=404, text='Unknown bot')
+        window = self._windows.get(name)
+        if window is None:
+            window = self._windows[name] = UpdateWindow(self.dedup_window)
+        update_id = None
+        try:
+            body = await request.read()
+            data = None
+            update_id = peek_update_id(body)
+            if update_id is None:
+                data = fastpath.loads(body)
+                update_id = data.get('update_id')
+            if update_id is not None and window.seen(update_id):
+                metrics.inc('duplicate_updates_total', (('bot', name),))
+                return web.Response(text='OK')
+            if data is None:
+                data = fastpath.loads(body)
+            update = self._fast_view(application, data) or Update.de_json(data, application.bot)
+            if not self.inline_replies:
+                await application.update_queue.put(update)
+                return web.Response(text='OK')
+
+            reply = InlineReply()
+            token = inline_reply.set(reply)
+            try:
+                # Same concurrency limit and per-chat ordering as queued updates
+                await application.update_processor.process_update(update, application.process_update(update))
+            finally:
+                inline_reply.reset(token)
+            if reply.method is None:
+                return web.Response(text='OK')
+            return web.json_response(reply.as_body())
+        except Exception as e:
+            logger.error(f"Error processing webhook: {e}")
+            if update_id is not None:
+                # Let Telegram's retry through
+                window.forget(update_id)
+            return web.Response(status=500, text='Error')
+
+    def _fast_view(self, application, data):
+        if not self.fast_path:
+            return None
+        accepts = self._accepts_views.get(application)
+        if accepts is None:
+            accepts = self._accepts_views[application] = fastpath.accepts_views(application)
+        return fastpath.view(data, application.bot) if accepts else None
+
+    async def health(self, request):
+        """Liveness: the loop is serving requests; reports how backed up it is now and lately."""
+        return web.json_response({
+            'status': 'ok',
+            'loop_lag_ms': round(await loop_lag() * 1000, 3),
+            'loop_lag_p99_ms': round(loop_monitor.percentile(0.99) * 1000, 3),
+            'uptime_s': round(time.monotonic() - health.started, 1),
+        })
+
+    async def ready(self, request):
+        """Readiness: 200 when every bot can take updates, else 503, with per-bot details."""
+        ready, bots = self.readiness()
+        return web.json_response({'ready': ready, 'bots': bots}, status=200 if ready else 503)
+
+    def _all_running(self):
+        bots = {name: {'running': app.running} for name, app in self.applications.items()}
+        return bool(bots) and all(bot['running'] for bot in bots.values()), bots
+
+    async def export_metrics(self, request):
+        """Prometheus metrics endpoint."""
+        return web.Response(text=metrics.render(), content_type='text/plain')
+
+    async def home(self, request):
+        """Home endpoint."""
+        return web.Response(text=self.home_text)
+
+    async def start(self, port: int, host='0.0.0.0') -> None:
+        # Keep-alive lets Telegram reuse its connection across webhook deliveries
+        self._runner = web.AppRunner(self.app, access_log=None, keepalive_timeout=75)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, host, port).start()
+        logger.info(f"Web server started on port {port}")
+
+    async def stop(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
@@ -0,0 +1,84 @@
+"""
+Startup timing: how long each phase from process start to the first reply takes.
+
+The entry points import this module before anything heavy, so its clock starts
+with the process. Phases are timed with ``timer.phase(name)``, milestones such
+as ``ready`` and ``first_reply`` with ``timer.mark(name)``. For a per-module
+breakdown of an import phase run the entry point with ``python -X importtime``.
+"""
+
+import os
+import time
+import logging
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+_STARTED = time.perf_counter()
+
+
+class StartupTimer:
+    """Record startup phases and milestones as offsets from process start.
+
+    Every entry is also exported as the ``startup_seconds{phase}`` gauge. If the
+    first reply comes later than ``target`` seconds (env ``STARTUP_TARGET_SECONDS``,
+    default 10) a warning is logged.
+    """
+
+    def __init__(self, started=_STARTED, target=None):
+        self.started = started
+        self.target = target or float(os.getenv('STARTUP_TARGET_SECONDS', 10))
+        # (name, offset in seconds, duration in seconds or None for milestones)
+        self.entries = []
+        self._marks = set()
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+    @contextmanager
+    def phase(self, name: str):
+        offset = self.elapsed()
+        try:
+            yield
+        finally:
+            self._record(name, offset, self.elapsed() - offset)
+
+    def mark(self, name: str) -> bool:
+        """Record milestone ``name`` the first time it is reached; return whether it was new."""
+        if name in self._marks:
+            return False
+        self._marks.add(name)
+        self._record(name, self.elapsed(), None)
+        return True
+
+    def _record(self, name: str, offset: float, duration) -> None:
+        self.entries.append((name, offset, duration))
+        # Imported here so importing this module stays free
+        from core.metrics import metrics
+        value = offset if duration is None else duration
+        metrics.gauge('startup_seconds', (('phase', name),), lambda: round(value, 6))
+
+    def report(self) -> str:
+        """The recorded entries as a table of start offset and duration in milliseconds."""
+        lines = [f"{'start ms':>10} {'took ms':>9}  phase"]
+        for name, offset, duration in sorted(self.entries, key=lambda entry: entry[1]):
+            took = f"{duration * 1000:>9.1f}" if duration is not None else f"{'':>9}"
+            lines.append(f"{offset * 1000:>10.1f} {took}  {name}")
+        return '\n'.join(lines)
+
+    def log_report(self) -> None:
+        logger.info(f"⏱️ Startup timing:\n{self.report()}")
+
+    def first_reply(self) -> None:
+        """Mark the first handled update and check it against the target."""
+        if not self.mark('first_reply'):
+            return
+        elapsed = self.elapsed()
+        if elapsed > self.target:
+            logger.warning(f"⚠️ First reply {elapsed:.2f}s after start, over the {self.target:.1f}s target")
+        else:
+            logger.info(f"⏱️ First reply {elapsed:.2f}s after start (target {self.target:.1f}s)")
+
+
+# Shared by the entry point and the host
+timer = StartupTimer()
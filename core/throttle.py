@@ -0,0 +1,66 @@
+"""
+Per-user tap throttling: token buckets in fixed-size arrays.
+"""
+
+import os
+import time
+from array import array
+
+from core.metrics import metrics
+
+# Slots looked at for a user before one is taken over
+PROBES = 4
+
+
+class TapThrottle:
+    """A token bucket per user, ``rate`` taps/s with bursts of ``burst`` (env ``TAP_RATE``,
+    default 1, and ``TAP_BURST``, default 5).
+
+    Buckets live in three flat arrays of ``capacity`` slots (env ``TAP_THROTTLE_CAPACITY``,
+    default 65536), 20 bytes each, so memory is fixed however many users tap: two
+    million slots take 40 MB. A user hashes to a slot and may use the next ``PROBES``
+    ones. A user who is not there takes over the slot that was updated longest ago.
+    That is normally an idle user whose bucket is full again, so nothing is lost. If
+    every probed slot is busy, the slot's owner is evicted with ``throttle_evictions_total``
+    counted and gets a full bucket the next time.
+    """
+
+    def __init__(self, rate=None, burst=None, capacity=None):
+        self.rate = rate or float(os.getenv('TAP_RATE', 1))
+        self.burst = burst or float(os.getenv('TAP_BURST', 5))
+        self.capacity = capacity or int(os.getenv('TAP_THROTTLE_CAPACITY', 65536))
+        # An emptied bucket is full again after this long; its slot can then be reused
+        self.refill_seconds = self.burst / self.rate
+        # User id 0 marks a free slot; Telegram user ids are positive
+        self._users = array('q', [0]) * self.capacity
+        self._tokens = array('f', [0.0]) * self.capacity
+        self._updated = array('d', [0.0]) * self.capacity
+
+    def _slot(self, user_id: int, now: float) -> int:
+        capacity, users, updated = self.capacity, self._users, self._updated
+        start = hash(user_id) % capacity
+        oldest = start
+        for i in range(PROBES):
+            slot = (start + i) % capacity
+            if users[slot] == user_id:
+                return slot
+            if updated[slot] < updated[oldest]:
+                oldest = slot
+        if users[oldest] and now - updated[oldest] < self.refill_seconds:
+            metrics.inc('throttle_evictions_total', ())
+        users[oldest] = user_id
+        self._tokens[oldest] = self.burst
+        updated[oldest] = now
+        return oldest
+
+    def allow(self, user_id: int, now=None) -> bool:
+        """Take a token from ``user_id``'s bucket; False when it is empty."""
+        now = time.monotonic() if now is None else now
+        slot = self._slot(user_id, now)
+        tokens = min(self.burst, self._tokens[slot] + (now - self._updated[slot]) * self.rate)
+        self._updated[slot] = now
+        if tokens < 1:
+            self._tokens[slot] = tokens
+            return False
+        self._tokens[slot] = tokens - 1
+        return True
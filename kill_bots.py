@@ -11,9 +11,17 @@ import psutil
 import requests
 from dotenv import load_dotenv
 
+from core.http import api_base_url
+
 # Load environment variables
 load_dotenv()
 
+# Bot API base URL (BOT_API_BASE_URL points at a local stand-in server for testing)
+API_BASE_URL = api_base_url()
+
+# One keep-alive connection for every call instead of a new one per request
+session = requests.Session()
+
 def print_header():
     """Print script header."""
     print("=" * 60)
@@ -54,8 +62,8 @@ def delete_webhooks():
     for i, token in enumerate(tokens, 1):
         if token:
             try:
-                url = f"https://api.telegram.org/bot{token}/deleteWebhook"
-                response = requests.post(url, timeout=10)
+                url = f"{API_BASE_URL}{token}/deleteWebhook"
+                response = session.post(url, timeout=10)
                 if response.status_code == 200:
                     print(f"✅ تم حذف webhook للبوت {i}")
                 else:
@@ -89,8 +97,8 @@ def check_running_bots():
     for i, token in enumerate(tokens, 1):
         if token:
             try:
-                url = f"https://api.telegram.org/bot{token}/getMe"
-                response = requests.get(url, timeout=5)
+                url = f"{API_BASE_URL}{token}/getMe"
+                response = session.get(url, timeout=5)
                 if response.status_code == 200:
                     print(f"🟢 البوت {i} متاح ولكن لا يعمل")
                 else:
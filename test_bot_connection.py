@@ -8,13 +8,18 @@ import sys
 from dotenv import load_dotenv
 from telegram import Bot
 
+from core.http import SharedHTTPXRequest, api_base_url
+
 # Load environment variables
 load_dotenv()
 
-async def test_bot(token, name):
+# Bot API base URL (BOT_API_BASE_URL points at a local stand-in server for testing)
+API_BASE_URL = api_base_url()
+
+async def test_bot(token, name, request=None):
     """Test if a bot token is working"""
     try:
-        bot = Bot(token=token)
+        bot = Bot(token=token, base_url=API_BASE_URL, request=request)
         me = await bot.get_me()
         print(f"✅ {name} Bot: @{me.username} - {me.first_name}")
         return True
@@ -31,12 +36,17 @@ async def main():
         "French": os.getenv('BOT_TOKEN_FR')
     }
     
-    for name, token in tokens.items():
-        if token:
-            await test_bot(token, name)
-        else:
-            print(f"❌ {name} Bot: Token not found")
-        print()
+    # All bots share one connection pool, so the checks reuse one connection
+    request = SharedHTTPXRequest(connection_pool_size=1)
+    try:
+        for name, token in tokens.items():
+            if token:
+                await test_bot(token, name, request)
+            else:
+                print(f"❌ {name} Bot: Token not found")
+            print()
+    finally:
+        await request.shutdown()
 
 if __name__ == "__main__":
     asyncio.run(main())
@@ -0,0 +1,52 @@
+from core.dedup import UpdateWindow, peek_update_id
+
+
+def test_window_flags_repeats():
+    window = UpdateWindow(3)
+    assert not window.seen(1)
+    assert window.seen(1)
+    assert len(window) == 1
+
+
+def test_window_evicts_oldest():
+    window = UpdateWindow(3)
+    for update_id in (1, 2, 3, 4):
+        assert not window.seen(update_id)
+    assert not window.seen(1)
+    assert window.seen(4)
+    assert len(window) == 3
+
+
+def test_forget_lets_one_retry_through():
+    window = UpdateWindow(3)
+    window.seen(1)
+    window.forget(1)
+    assert not window.seen(1)
+    assert window.seen(1)
+
+
+def test_forgotten_slot_does_not_evict_retry():
+    window = UpdateWindow(3)
+    window.seen(1)
+    window.forget(1)
+    window.seen(1)
+    window.seen(2)
+    window.seen(3)
+    # The retry of 1 is still in the window; the slot it left must not evict it
+    assert window.seen(1)
+
+
+def test_forget_unknown_id_is_a_no_op():
+    window = UpdateWindow(2)
+    window.forget(7)
+    window.seen(1)
+    window.seen(2)
+    assert window.seen(1) and window.seen(2)
+
+
+def test_peek_update_id():
+    assert peek_update_id(b'{"update_id":123456,"message":{}}') == 123456
+    assert peek_update_id(b'{"message":{},"update_id":1}') is None
+    assert peek_update_id(b'{"update_id":12}') is None
+    assert peek_update_id(b'{"update_id":abc,"x":1}') is None
+    assert peek_update_id(b'') is None
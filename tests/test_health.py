@@ -0,0 +1,24 @@
+from core.health import API_ERROR_SECONDS, HealthState
+
+
+def test_reachable_until_a_call_fails():
+    state = HealthState()
+    assert state.api_reachable('eng')
+    state.api_error('eng')
+    assert not state.api_reachable('eng')
+    assert state.api_reachable('ara')
+
+
+def test_later_success_clears_error():
+    state = HealthState()
+    state.api_error('eng')
+    state.api_ok('eng')
+    assert state.api_reachable('eng')
+
+
+def test_error_expires_without_further_calls():
+    state = HealthState()
+    state.api_error('eng')
+    failed = state.last_api_error['eng']
+    assert not state.api_reachable('eng', now=failed + API_ERROR_SECONDS - 1)
+    assert state.api_reachable('eng', now=failed + API_ERROR_SECONDS)
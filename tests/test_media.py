@@ -0,0 +1,56 @@
+import json
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from telegram.error import BadRequest
+
+from core.media import Asset, MediaRegistry, is_stale_file_id
+
+
+def test_is_stale_file_id():
+    assert is_stale_file_id(BadRequest('Wrong file identifier/http url specified'))
+    assert is_stale_file_id(BadRequest('Wrong remote file identifier specified: wrong padding in the string'))
+    assert is_stale_file_id(BadRequest('File reference expired'))
+    assert not is_stale_file_id(BadRequest('Chat not found'))
+    assert not is_stale_file_id(BadRequest("Can't parse entities: can't find end of the entity"))
+
+
+class FakeBot:
+    token = '123:secret'
+
+    def __init__(self, error):
+        self.error = error
+        self.sent = []
+
+    async def send_photo(self, chat_id, photo, **kwargs):
+        self.sent.append(photo)
+        if isinstance(photo, str):
+            raise self.error
+        return SimpleNamespace(photo=[SimpleNamespace(file_id='new-id')])
+
+
+def registry_with_cached_id(tmp_path, asset):
+    cache = tmp_path / 'media_cache.json'
+    cache.write_text(json.dumps({'123': {asset.name: {'file_id': 'old-id', 'sha256': asset.digest}}}))
+    return MediaRegistry(str(cache))
+
+
+def test_other_bad_request_is_raised_without_upload(tmp_path):
+    asset = Asset('logo.png', 'logo.jpg', b'jpeg bytes')
+    registry = registry_with_cached_id(tmp_path, asset)
+    assert registry.get('123', asset.name, asset.digest) == 'old-id'
+    bot = FakeBot(BadRequest('Chat not found'))
+    with pytest.raises(BadRequest):
+        asyncio.run(registry.send_photo(bot, 1, asset))
+    assert bot.sent == ['old-id']
+    assert registry.get('123', asset.name, asset.digest) == 'old-id'
+
+
+def test_stale_file_id_is_uploaded_again(tmp_path):
+    asset = Asset('logo.png', 'logo.jpg', b'jpeg bytes')
+    registry = registry_with_cached_id(tmp_path, asset)
+    bot = FakeBot(BadRequest('Wrong file identifier/http url specified'))
+    asyncio.run(registry.send_photo(bot, 1, asset))
+    assert len(bot.sent) == 2
+    assert registry.get('123', asset.name, asset.digest) == 'new-id'
@@ -0,0 +1,49 @@
+import asyncio
+import time
+from types import SimpleNamespace
+
+from core.processor import ChatOrderedUpdateProcessor
+
+
+def chat_update(chat_id):
+    return SimpleNamespace(effective_chat=SimpleNamespace(id=chat_id))
+
+
+async def handle(finished, name, seconds):
+    await asyncio.sleep(seconds)
+    finished[name] = time.monotonic()
+
+
+def test_other_chat_not_blocked_by_one_chats_backlog():
+    async def scenario():
+        processor = ChatOrderedUpdateProcessor(2)
+        finished = {}
+        started = time.monotonic()
+        tasks = [
+            asyncio.create_task(processor.process_update(chat_update(1), handle(finished, f'a{i}', 0.5)))
+            for i in range(3)
+        ]
+        await asyncio.sleep(0)
+        tasks.append(asyncio.create_task(processor.process_update(chat_update(2), handle(finished, 'b', 0.01))))
+        await asyncio.gather(*tasks)
+        return started, finished
+
+    started, finished = asyncio.run(scenario())
+    assert finished['b'] - started < 0.25
+    assert finished['a0'] < finished['a1'] < finished['a2']
+
+
+def test_limit_caps_running_updates():
+    async def scenario():
+        processor = ChatOrderedUpdateProcessor(2)
+        peak = 0
+
+        async def track():
+            nonlocal peak
+            peak = max(peak, processor.in_flight)
+            await asyncio.sleep(0.01)
+
+        await asyncio.gather(*(processor.process_update(chat_update(i), track()) for i in range(6)))
+        return peak, processor.completed
+
+    assert asyncio.run(scenario()) == (2, 6)